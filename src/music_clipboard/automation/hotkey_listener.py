@@ -1,4 +1,5 @@
 import os
+import socket
 import subprocess
 import sys
 import tempfile
@@ -8,7 +9,13 @@ from pathlib import Path
 if __package__ is None or __package__ == "":
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from music_clipboard.platform.runtime import IS_MACOS, IS_WINDOWS, default_hotkey
+from music_clipboard.platform.runtime import (
+    IS_MACOS,
+    IS_WINDOWS,
+    default_hotkey,
+    gui_pid_file,
+    hotkey_socket_path,
+)
 
 try:
     if IS_MACOS:
@@ -21,13 +28,10 @@ except ImportError:
     keyboard = None
     pynput_keyboard = None
 
-try:
-    import psutil
-except ImportError:
-    psutil = None
-
 GUI_MODULE = "music_clipboard.gui.app"
 REQUEST_FILE = Path(tempfile.gettempdir()) / "musescore_hotkey_request.txt"
+GUI_PID_FILE = gui_pid_file()
+HOTKEY_SOCKET = hotkey_socket_path()
 HOTKEY = default_hotkey()
 
 
@@ -40,49 +44,77 @@ def _get_interpreter():
     return interpreter
 
 
-def _is_gui_running():
-    if psutil is None:
+# Built once; the hotkey path only needs to hand these to Popen.
+_GUI_ARGV = [
+    str(_get_interpreter()),
+    "-m",
+    GUI_MODULE,
+    "--trigger-save-selection",
+    "--disable-global-hotkey",
+]
+if IS_WINDOWS:
+    _GUI_POPEN_KWARGS = {"creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0)}
+else:
+    # Detach into its own session so the GUI outlives the listener's terminal.
+    _GUI_POPEN_KWARGS = {"start_new_session": True}
+if IS_MACOS:
+    _GUI_POPEN_KWARGS.update(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _pid_alive(pid):
+    if IS_WINDOWS:
+        # os.kill(pid, 0) would terminate the process on Windows.
+        import ctypes
+
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return False
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except OSError:
         return False
+    return True
 
-    for proc in psutil.process_iter(["cmdline", "name"]):
-        try:
-            cmdline = proc.info.get("cmdline") or []
-            name = proc.info.get("name") or ""
-            joined = " ".join(str(part) for part in cmdline)
-            if GUI_MODULE in joined:
-                return True
-            if "python" in name.lower() and "music_clipboard/gui/app.py" in joined.replace("\\", "/"):
-                return True
-            for part in cmdline:
-                if not part:
-                    continue
-                if os.path.basename(str(part)) == "app.py" and "music_clipboard" in str(part):
-                    return True
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
-    return False
+
+def _is_gui_running():
+    try:
+        pid = int(GUI_PID_FILE.read_text().strip())
+    except (OSError, ValueError):
+        return False
+    return pid > 0 and _pid_alive(pid)
 
 
 def _start_gui():
-    interpreter = _get_interpreter()
-    creation_flags = getattr(subprocess, "CREATE_NO_WINDOW", 0) if IS_WINDOWS else 0
-    stdout = subprocess.DEVNULL if IS_MACOS else None
-    stderr = subprocess.DEVNULL if IS_MACOS else None
-    subprocess.Popen(
-        [
-            str(interpreter),
-            "-m",
-            GUI_MODULE,
-            "--trigger-save-selection",
-            "--disable-global-hotkey",
-        ],
-        creationflags=creation_flags,
-        stdout=stdout,
-        stderr=stderr,
-    )
+    subprocess.Popen(_GUI_ARGV, close_fds=True, **_GUI_POPEN_KWARGS)
+
+
+def _signal_gui_socket():
+    if IS_WINDOWS or not hasattr(socket, "AF_UNIX"):
+        return False
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.sendto(b"1", str(HOTKEY_SOCKET))
+        return True
+    except OSError:
+        return False
 
 
 def _signal_gui():
+    if _signal_gui_socket():
+        return
     try:
         REQUEST_FILE.parent.mkdir(parents=True, exist_ok=True)
         REQUEST_FILE.write_text(str(time.time()))
@@ -111,11 +143,6 @@ def main():
                 "Install it with: pip install keyboard"
             )
 
-    if psutil is None:
-        print(
-            "Warning: psutil is not installed. The listener will always restart the GUI instead of signaling the running one."
-        )
-
     try:
         REQUEST_FILE.parent.mkdir(parents=True, exist_ok=True)
         REQUEST_FILE.write_text(str(time.time()))
@@ -1,21 +1,60 @@
+import asyncio
+import hashlib
+import io
+import json
 import os
 import shutil
+import struct
 import subprocess
 import sys
-import xml.etree.ElementTree as ET
+import tempfile
+import time
 import zipfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 if __package__ is None or __package__ == "":
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from music_clipboard.platform.runtime import IS_MACOS, IS_WINDOWS, output_dirs
+from music_clipboard.extract.xmlstream import find_score_member, iter_end_elements, prune
+from music_clipboard.platform.runtime import IS_MACOS, IS_WINDOWS, note_cache_dir, output_dirs
 
 DEFAULT_MIDI_TEMPO = 120
+_TICKS_PER_BEAT = 480
+_NOTE_VELOCITY = 64
+# Channel-0 status bytes, indexed by event kind (0 = note_off, 1 = note_on).
+_NOTE_STATUS = (0x80, 0x90)
 MIDI_OUTPUT_DIR = output_dirs()[1]
-
-
+_SCORE_TAGS = ("Division", "Measure")
+# Bump when iter_score_notes changes what it yields, so stale cache entries are ignored.
+_NOTE_CACHE_VERSION = b"1"
+# Most recently used note tables kept on disk; older ones are evicted when a table is written.
+NOTE_CACHE_MAX_ENTRIES = 256
+# Temp files this old are left over from a crashed write and are removed during eviction.
+_NOTE_CACHE_STALE_TMP_SECONDS = 3600
+
+
+@contextmanager
+def _open_score(mscx_file_path):
+    """Open the score XML of a .mscx or .mscz file as a binary stream."""
+    if not mscx_file_path.lower().endswith(".mscz"):
+        with open(mscx_file_path, "rb") as f:
+            yield f
+        return
+
+    with zipfile.ZipFile(mscx_file_path, "r") as zip_ref:
+        # ZipExtFile is slow with the parser's small reads; buffer them.
+        with zip_ref.open(find_score_member(zip_ref)) as raw, io.BufferedReader(raw, buffer_size=1 << 16) as f:
+            yield f
+
+
+@lru_cache(maxsize=1)
 def _find_musescore_exe():
+    """Path of the MuseScore executable, or None; looked up once per process."""
     musescore_paths = []
     if IS_MACOS:
         musescore_paths = [
@@ -44,109 +83,142 @@ def _find_musescore_exe():
     )
 
 
-def extract_midi_from_mscx(mscx_file_path, output_file_path=None, measure_range=None):
-    """Extract MIDI from .mscx or .mscz file using MuseScore CLI or mido library
-
-    Args:
-        mscx_file_path: Path to the MuseScore file
-        output_file_path: Path for output MIDI file (optional, auto-generated if None)
-        measure_range: Tuple (start_measure, end_measure) to extract only specific measures (1-indexed, inclusive)
-                       If None, extracts all measures. Note: Only supported with library-based extraction.
-
-    Returns:
-        Path to the created MIDI file, or None if extraction failed
-    """
+@lru_cache(maxsize=None)
+def _ensure_output_dir():
+    """Normalized MIDI output directory, created on first use only."""
     output_dir = os.path.normpath(str(MIDI_OUTPUT_DIR))
     os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
 
+def default_output_path(mscx_file_path):
+    """MIDI path for ``mscx_file_path`` in the MIDI output folder (created if needed)."""
     base_name = os.path.splitext(os.path.basename(mscx_file_path))[0]
-    if output_file_path is None:
-        filename = base_name + ".mid"
-        output_file_path = os.path.normpath(os.path.join(output_dir, filename))
+    return os.path.join(_ensure_output_dir(), base_name + ".mid")
 
-    musescore_exe = _find_musescore_exe()
 
-    if musescore_exe and measure_range is None:
+async def _run_musescore_jobs(musescore_exe, job_files, timeouts):
+    """Run one ``MuseScore -j`` process per job file concurrently, killing any that overrun."""
+
+    async def run(job_file, timeout):
         try:
-            result = subprocess.run(
-                [musescore_exe, "-o", output_file_path, mscx_file_path],
-                capture_output=True,
-                text=True,
-                timeout=30,
+            proc = await asyncio.create_subprocess_exec(
+                musescore_exe,
+                "-j",
+                job_file,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            if result.returncode == 0 and os.path.exists(output_file_path):
-                return output_file_path
+        except OSError:
+            return
+        try:
+            await asyncio.wait_for(proc.wait(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
 
-            result = subprocess.run(
-                [musescore_exe, mscx_file_path, "-o", output_file_path],
-                capture_output=True,
-            )
-            if result.returncode == 0 and os.path.exists(output_file_path):
-                return output_file_path
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-            pass
+    await asyncio.gather(*(run(job_file, timeout) for job_file, timeout in zip(job_files, timeouts)))
+
+
+async def musescore_batch_convert_async(musescore_exe, jobs, max_workers=None):
+    """Convert every ``{score: midi}`` pair in ``jobs`` with MuseScore job files (``-j``).
 
+    The jobs are split across up to ``max_workers`` (default: CPU count) MuseScore
+    processes running side by side, each paying the startup cost once for its share.
+    Returns the subset that MuseScore actually wrote; the rest are left to the caller.
+    Await this from code that already runs an event loop (e.g. the GUI's background loop).
+    """
+    items = list(jobs.items())
+    workers = max(1, min(len(items), max_workers or os.cpu_count() or 1))
+    chunks = [items[i::workers] for i in range(workers)]
+
+    started = time.time()
+    job_files = []
     try:
-        import mido
-        from mido import Message, MidiFile, MidiTrack
-
-        if mscx_file_path.endswith(".mscz"):
-            with zipfile.ZipFile(mscx_file_path, "r") as zip_ref:
-                file_list = zip_ref.namelist()
-                score_file = None
-                for name in file_list:
-                    if name.endswith(".mscx") or ("." not in name and not name.endswith("/")):
-                        score_file = name
-                        break
-                if score_file is None:
-                    score_file = file_list[0]
-                with zip_ref.open(score_file) as f:
-                    tree = ET.parse(f)
-                    root = tree.getroot()
-        else:
-            tree = ET.parse(mscx_file_path)
-            root = tree.getroot()
+        for chunk in chunks:
+            with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+                job_files.append(f.name)
+                json.dump([{"in": score, "out": midi} for score, midi in chunk], f)
+        await _run_musescore_jobs(musescore_exe, job_files, [30 + 10 * len(chunk) for chunk in chunks])
+    except OSError:
+        pass
+    finally:
+        for job_file in job_files:
+            try:
+                os.unlink(job_file)
+            except OSError:
+                pass
+
+    converted = {}
+    for score, midi in items:
+        try:
+            # Ignore stale files left over from an earlier run.
+            if os.stat(midi).st_mtime >= started - 1:
+                converted[score] = midi
+        except OSError:
+            pass
+    return converted
 
-        division = 480
-        for elem in root.iter("Division"):
-            if elem.text:
-                division = int(elem.text)
-                break
 
-        mid = MidiFile()
-        track = MidiTrack()
-        mid.tracks.append(track)
+def _musescore_batch_convert(musescore_exe, jobs, max_workers=None):
+    """Synchronous :func:`musescore_batch_convert_async`, for callers without an event loop.
 
-        tempo = mido.bpm2tempo(DEFAULT_MIDI_TEMPO)
-        track.append(Message("set_tempo", tempo=tempo, time=0))
+    Raises RuntimeError when called from a thread that is already running a loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(musescore_batch_convert_async(musescore_exe, jobs, max_workers))
+    raise RuntimeError(
+        "MuseScore batch conversion is synchronous here; "
+        "await musescore_batch_convert_async() from code running in an event loop"
+    )
 
-        notes = []
 
-        all_measures = list(root.iter("Measure"))
-        measures_to_process = []
-        start_tick_offset = 0
+def iter_score_notes(mscx_file_path, measure_range=None):
+    """Yield ``(tick, midi_pitch, duration)`` for every chord note, in document order.
 
-        if measure_range:
-            start_measure, end_measure = measure_range
-            for idx, measure in enumerate(all_measures):
+    Measures are handled as each one finishes parsing and then dropped, so only the
+    current measure's subtree is held in memory. ``measure_range`` is as for
+    :func:`extract_midi_from_mscx`.
+    """
+    division = None
+    start_tick_offset = 0
+    current_tick = 0
+
+    with _open_score(mscx_file_path) as source:
+        measure_idx = 0
+        for elem in iter_end_elements(source, _SCORE_TAGS):
+            if elem.tag == "Division":
+                if division is None and elem.text:
+                    division = int(elem.text)
+                continue
+
+            measure = elem
+            measure_idx += 1
+            if division is None:
+                # <Division> precedes the staves in every MuseScore file; use the default if absent.
+                division = 480
+
+            if measure_range:
+                start_measure, end_measure = measure_range
                 measure_no_attr = measure.get("no")
                 if measure_no_attr is not None:
                     try:
                         measure_no = int(measure_no_attr)
                     except (ValueError, TypeError):
-                        measure_no = idx + 1
+                        measure_no = measure_idx
                 else:
-                    measure_no = idx + 1
+                    measure_no = measure_idx
 
                 if measure_no < start_measure:
                     start_tick_offset += division * 4
-                elif start_measure <= measure_no <= end_measure:
-                    measures_to_process.append((measure_no, measure))
-        else:
-            measures_to_process = [(idx + 1, m) for idx, m in enumerate(all_measures)]
+                    prune(measure)
+                    continue
+                if measure_no > end_measure:
+                    prune(measure)
+                    continue
 
-        current_tick = 0
-        for measure_no, measure in measures_to_process:
             measure_tick = 0
 
             for chord in measure.iter("Chord"):
@@ -158,46 +230,238 @@ def extract_midi_from_mscx(mscx_file_path, output_file_path=None, measure_range=
                     else:
                         chord_tick = tick_val - start_tick_offset
 
-                duration = division
-                duration_elem = chord.find("duration")
-                if duration_elem is not None and duration_elem.text:
-                    duration = int(duration_elem.text)
-
-                for note in chord.findall("Note"):
-                    pitch_elem = note.find("pitch")
-                    if pitch_elem is not None and pitch_elem.text:
-                        midi_pitch = int(pitch_elem.text)
-                        notes.append((current_tick + chord_tick, midi_pitch, duration))
+                # One pass over the chord's children; <duration> may follow the notes.
+                duration = None
+                pitches = []
+                for child in chord:
+                    tag = child.tag
+                    if tag == "Note":
+                        pitch_elem = child.find("pitch")
+                        if pitch_elem is not None and pitch_elem.text:
+                            pitches.append(int(pitch_elem.text))
+                    elif tag == "duration" and duration is None and child.text:
+                        duration = int(child.text)
+                if duration is None:
+                    duration = division
+
+                tick = current_tick + chord_tick
+                for pitch in pitches:
+                    yield tick, pitch, duration
 
                 measure_tick = max(measure_tick, chord_tick + duration)
 
             current_tick += measure_tick if measure_tick > 0 else division * 4
+            prune(measure)
 
-        notes.sort(key=lambda x: x[0])
 
-        last_tick = 0
-        for tick, pitch, duration in notes:
-            delta = tick - last_tick
-            track.append(Message("note_on", channel=0, note=pitch, velocity=64, time=delta))
-            track.append(Message("note_off", channel=0, note=pitch, velocity=64, time=duration))
-            last_tick = tick + duration
+def _note_cache_path(mscx_file_path, measure_range):
+    digest = hashlib.blake2b(_NOTE_CACHE_VERSION, digest_size=16)
+    with open(mscx_file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(repr(measure_range).encode())
+    return note_cache_dir() / f"{digest.hexdigest()}.notes"
 
-        mid.save(output_file_path)
-        return output_file_path
 
-    except ImportError:
+def _prune_note_cache(cache_dir):
+    """Keep only the NOTE_CACHE_MAX_ENTRIES most recently used tables in ``cache_dir``.
+
+    Temp files left behind by an interrupted write are removed once they are stale.
+    """
+    tables = []
+    doomed = []
+    stale_before = time.time() - _NOTE_CACHE_STALE_TMP_SECONDS
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if entry.name.endswith(".notes"):
+                    tables.append((mtime, entry.path))
+                elif entry.name.endswith(".tmp") and mtime < stale_before:
+                    doomed.append(entry.path)
+    except OSError:
+        return
+
+    tables.sort(reverse=True)
+    doomed.extend(path for _, path in tables[NOTE_CACHE_MAX_ENTRIES:])
+    for path in doomed:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def load_score_notes(mscx_file_path, measure_range=None):
+    """Return ``list(iter_score_notes(...))``, reusing a cached table for identical score bytes.
+
+    Tables are stored as flat native ``int32`` triples, so a hit costs one hash of the file
+    and one read instead of an XML parse. Cache failures fall back to parsing.
+    """
+    cache_path = None
+    try:
+        cache_path = _note_cache_path(mscx_file_path, measure_range)
+        flat = array("i")
+        flat.frombytes(cache_path.read_bytes())
+        if len(flat) % 3 == 0:
+            try:
+                # Mark the table as recently used, so eviction drops older ones first.
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return list(zip(flat[0::3], flat[1::3], flat[2::3]))
+    except (OSError, ValueError):
+        pass
+
+    notes = list(iter_score_notes(mscx_file_path, measure_range))
+    if cache_path is not None:
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            flat = array("i", [value for note in notes for value in note])
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(flat.tobytes())
+            os.replace(tmp_path, cache_path)
+        except (OSError, OverflowError):
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+        else:
+            _prune_note_cache(cache_path.parent)
+    return notes
+
+
+@lru_cache(maxsize=4096)
+def _varlen(value):
+    """Encode a non-negative int as a MIDI variable-length quantity."""
+    if value < 0:
+        raise ValueError(f"MIDI delta time must be non-negative, got {value}")
+    out = [value & 0x7F]
+    value >>= 7
+    while value:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(out))
+
+
+def write_midi_notes(notes, output_file_path):
+    """Write ``(tick, midi_pitch, duration)`` notes to a single-track MIDI file.
+
+    The file is encoded directly (format 1, 480 ticks per beat, running status) instead
+    of building a mido message per event.
+    """
+    # Absolute-time events, note_off (0) before note_on (1) on the same tick, so
+    # overlapping notes and chords never produce negative delta times. Notes arrive
+    # in score order, which is already tick order except where a chord carries an
+    # explicit tick; timsort handles those runs in a single linear pass.
+    # A zero-length note's note_off would sort ahead of its note_on and leave it hanging;
+    # such notes are inaudible anyway, so they are dropped.
+    notes = [note for note in notes if note[2] > 0]
+    events = [(tick, 1, pitch) for tick, pitch, _ in notes]
+    events += [(tick + duration, 0, pitch) for tick, pitch, duration in notes]
+    events.sort(key=itemgetter(0, 1))
+    if events and not (0 <= min(map(itemgetter(2), events)) and max(map(itemgetter(2), events)) < 128):
+        raise ValueError("MIDI pitch out of range 0-127")
+    if events and events[0][0] < 0:
+        raise ValueError(f"MIDI event at negative tick {events[0][0]}")
+
+    tempo = round(60_000_000 / DEFAULT_MIDI_TEMPO)
+    track = bytearray(b"\x00\xff\x51\x03" + tempo.to_bytes(3, "big"))
+    status = None
+    last_tick = 0
+    for tick, kind, pitch in events:
+        track += _varlen(tick - last_tick)
+        last_tick = tick
+        if _NOTE_STATUS[kind] != status:
+            status = _NOTE_STATUS[kind]
+            track.append(status)
+        track.append(pitch)
+        track.append(_NOTE_VELOCITY)
+    track += b"\x00\xff\x2f\x00"
+
+    header = b"MThd" + struct.pack(">IHHH", 6, 1, 1, _TICKS_PER_BEAT)
+    with open(output_file_path, "wb") as f:
+        f.write(header + b"MTrk" + struct.pack(">I", len(track)) + track)
+    return output_file_path
+
+
+def extract_midi_from_mscx(mscx_file_path, output_file_path=None, measure_range=None):
+    """Extract MIDI from .mscx or .mscz file using MuseScore CLI or the built-in writer
+
+    Args:
+        mscx_file_path: Path to the MuseScore file
+        output_file_path: Path for output MIDI file (optional, auto-generated if None)
+        measure_range: Tuple (start_measure, end_measure) to extract only specific measures (1-indexed, inclusive)
+                       If None, extracts all measures. Note: Only supported with the built-in writer.
+
+    Returns:
+        Path to the created MIDI file, or None if extraction failed
+    """
+    _ensure_output_dir()
+    if output_file_path is None:
+        output_file_path = default_output_path(mscx_file_path)
+
+    musescore_exe = _find_musescore_exe()
+
+    if musescore_exe and measure_range is None:
         try:
-            from music21 import converter
-
-            score = converter.parse(mscx_file_path)
-            score.write("midi", output_file_path)
-            return output_file_path
-        except ImportError:
-            raise ImportError(
-                "MIDI extraction requires either:\n"
-                "1. MuseScore command-line tool installed, or\n"
-                "2. Python library 'mido' (pip install mido), or\n"
-                "3. Python library 'music21' (pip install music21)"
+            result = subprocess.run(
+                [musescore_exe, "-o", output_file_path, mscx_file_path],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            if result.returncode == 0 and os.path.exists(output_file_path):
+                return output_file_path
+
+            result = subprocess.run(
+                [musescore_exe, mscx_file_path, "-o", output_file_path],
+                capture_output=True,
             )
+            if result.returncode == 0 and os.path.exists(output_file_path):
+                return output_file_path
+        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+            pass
+
+    try:
+        write_midi_notes(load_score_notes(mscx_file_path, measure_range), output_file_path)
+        return output_file_path
     except Exception as e:
         raise Exception(f"Failed to extract MIDI: {str(e)}")
+
+
+def _extract_midi_or_none(mscx_file_path):
+    try:
+        return extract_midi_from_mscx(mscx_file_path)
+    except Exception as e:
+        print(f"Error processing file {mscx_file_path}: {e}")
+        return None
+
+
+def extract_midi_batch(paths, max_workers=None):
+    """Convert several scores to MIDI.
+
+    With a MuseScore executable available, the scores are shared out between a few concurrent
+    MuseScore job runs so startup is paid once per run rather than per file; anything they could
+    not convert (or everything, without MuseScore) is converted in parallel worker processes.
+    Returns a dict mapping each path to its MIDI path (None on failure).
+
+    Blocks until done, so call it from plain (non-async) code or a worker thread.
+    """
+    paths = [str(path) for path in paths]
+    results = {}
+
+    musescore_exe = _find_musescore_exe()
+    if musescore_exe and len(paths) > 1:
+        jobs = {path: default_output_path(path) for path in paths}
+        results.update(_musescore_batch_convert(musescore_exe, jobs, max_workers))
+
+    remaining = [path for path in paths if path not in results]
+    if len(remaining) <= 1:
+        results.update({path: _extract_midi_or_none(path) for path in remaining})
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results.update(zip(remaining, executor.map(_extract_midi_or_none, remaining)))
+    return {path: results[path] for path in paths}
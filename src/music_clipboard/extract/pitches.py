@@ -1,115 +1,190 @@
+import argparse
+import io
+import mmap
 import os
 import sys
 import traceback
-import xml.etree.ElementTree as ET
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 if __package__ is None or __package__ == "":
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from music_clipboard.platform.runtime import output_dirs
-from music_clipboard.extract.midi import extract_midi_from_mscx
+from music_clipboard.extract.midi import (
+    default_output_path as midi_output_path,
+    extract_midi_batch,
+    extract_midi_from_mscx,
+    load_score_notes,
+    write_midi_notes,
+)
+from music_clipboard.extract.pitchnames import PITCH_TABLE, get_pitch_name
+from music_clipboard.extract.xmlstream import find_score_member, iter_end_elements, prune
 
 OUTPUT_DIR = output_dirs()[0]
 
+# Encoded output lines, so the text file can be written without per-note str work.
+_PITCH_LINES = tuple((name + os.linesep).encode("ascii") for name in PITCH_TABLE)
 
-def get_pitch_name(pitch_value):
-    """Convert MIDI pitch number to note name (e.g., 60 -> C4)."""
-    pitch_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    note = pitch_value % 12
-    octave = (pitch_value // 12) - 1
-    return f"{pitch_names[note]}{octave}"
+_MSCX_NS = "{http://www.musescore.org/mscx}"
+_NOTE_TAGS = frozenset(("Note", _MSCX_NS + "Note"))
+_PITCH_TAGS = frozenset(("pitch", _MSCX_NS + "pitch"))
+_CHORD_TAGS = frozenset(("Chord", _MSCX_NS + "Chord"))
+_MEASURE_TAGS = frozenset(("Measure", _MSCX_NS + "Measure"))
+# Chord counts only feed the debug report, and debug runs are unfiltered, so
+# the filtered fast path never needs Chord events.
+_STREAM_TAGS = tuple(_NOTE_TAGS | _MEASURE_TAGS)
+
+
+def _in_table_range(midi_pitches):
+    """Whether every pitch can be looked up in PITCH_TABLE directly (one C-level min/max)."""
+    return not midi_pitches or (min(midi_pitches) >= 0 and max(midi_pitches) < 128)
+
+
+def _pitch_names(midi_pitches):
+    """Names for a list of MIDI pitches; out-of-range values go through get_pitch_name."""
+    if _in_table_range(midi_pitches):
+        return list(map(PITCH_TABLE.__getitem__, midi_pitches))
+    return list(map(get_pitch_name, midi_pitches))
+
+
+def _write_pitch_file(output_file_path, midi_pitches):
+    """Write one pitch name per line, in a single write."""
+    if _in_table_range(midi_pitches):
+        data = b"".join(map(_PITCH_LINES.__getitem__, midi_pitches))
+    else:
+        data = "".join(name + os.linesep for name in map(get_pitch_name, midi_pitches)).encode("ascii")
+    with open(output_file_path, "wb") as f:
+        f.write(data)
+
+
+@lru_cache(maxsize=None)
+def _ensure_output_dir():
+    """Text output directory, created on first use only."""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return OUTPUT_DIR
+
+
+def _output_path(score_path):
+    """Where the pitch list for ``score_path`` is written."""
+    return OUTPUT_DIR / f"{Path(score_path).stem}_pitches.txt"
+
+
+@contextmanager
+def _mapped(f):
+    """Memory-map ``f`` read-only so the parser reads straight from the page cache.
+
+    Falls back to the plain file object when it cannot be mapped (e.g. empty files).
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        yield f
+        return
+    with mm:
+        yield mm
+
+
+@contextmanager
+def _open_score(mscx_file_path, debug=False):
+    """Open the score XML of a .mscx or .mscz file as a binary stream."""
+    if not mscx_file_path.lower().endswith(".mscz"):
+        with open(mscx_file_path, "rb") as f, _mapped(f) as source:
+            yield source
+        return
+
+    if debug:
+        print("Detected .mscz file, extracting...")
+    with zipfile.ZipFile(mscx_file_path, "r") as zip_ref:
+        score_info = find_score_member(zip_ref)
+        if debug:
+            print(f"Reading {score_info.filename} from archive...")
+        # ZipExtFile is slow with the parser's small reads; buffer them.
+        with zip_ref.open(score_info) as raw, io.BufferedReader(raw, buffer_size=1 << 16) as f:
+            yield f
+
+
+def _iter_pitch_texts(source, counts=None, debug=False):
+    """Stream ``source`` once, yielding raw <pitch> text and clearing parsed subtrees.
+
+    If given, ``counts`` is updated with the number of Note and Chord elements seen.
+    """
+    note_count = 0
+    chord_count = 0
+    structure = []
+    root = None
+
+    # Debug runs look at every element for the structure report.
+    for elem in iter_end_elements(source, None if debug else _STREAM_TAGS):
+        if debug:
+            # The document element closes last.
+            root = elem
+        if debug and len(structure) < 20:
+            sample = elem.text[:50] if elem.text and elem.text.strip() else ""
+            structure.append((elem.tag, sample))
+
+        tag = elem.tag
+        if tag in _NOTE_TAGS:
+            note_count += 1
+            for child in elem:
+                if child.tag in _PITCH_TAGS:
+                    if child.text:
+                        yield child.text
+                    break
+            prune(elem)
+        elif tag in _CHORD_TAGS:
+            chord_count += 1
+        elif tag in _MEASURE_TAGS:
+            prune(elem)
+
+    if counts is not None:
+        counts["notes"] = note_count
+        counts["chords"] = chord_count
+
+    if debug and root is not None:
+        print(f"\nRoot tag: {root.tag}")
+        print(f"Root attributes: {dict(root.attrib)}")
+        print("\nXML Structure (first 20 elements):")
+        for tag, sample in structure:
+            print(f"  {tag}: {sample}")
+
+
+def iter_pitches_from_mscx(mscx_file_path):
+    """Yield pitch names from a MuseScore .mscx or .mscz file one at a time.
+
+    The score is streamed, so stopping early (e.g. for a preview) skips the rest of the file.
+    """
+    with _open_score(mscx_file_path) as source:
+        yield from map(get_pitch_name, map(int, _iter_pitch_texts(source)))
 
 
 def extract_pitches_from_mscx(mscx_file_path, output_file_path=None, debug=False):
     """Extract pitch names from a MuseScore .mscx or .mscz file."""
     try:
-        if mscx_file_path.endswith(".mscz"):
-            if debug:
-                print("Detected .mscz file, extracting...")
-            with zipfile.ZipFile(mscx_file_path, "r") as zip_ref:
-                file_list = zip_ref.namelist()
-                score_file = None
-                for name in file_list:
-                    if name.endswith(".mscx") or ("." not in name and not name.endswith("/")):
-                        score_file = name
-                        break
-                if score_file is None:
-                    score_file = file_list[0]
-                if debug:
-                    print(f"Reading {score_file} from archive...")
-                with zip_ref.open(score_file) as f:
-                    tree = ET.parse(f)
-                    root = tree.getroot()
-        else:
-            tree = ET.parse(mscx_file_path)
-            root = tree.getroot()
+        counts = {"notes": 0, "chords": 0}
+        with _open_score(mscx_file_path, debug) as source:
+            midi_pitches = list(map(int, _iter_pitch_texts(source, counts, debug)))
 
-        if debug:
-            print(f"\nRoot tag: {root.tag}")
-            print(f"Root attributes: {root.attrib}")
-            print("\nXML Structure (first 20 elements):")
-            count = 0
-            for elem in root.iter():
-                if count < 20:
-                    sample = elem.text[:50] if elem.text and elem.text.strip() else ""
-                    print(f"  {elem.tag}: {sample}")
-                    count += 1
-
-        pitches = []
-
-        for chord in root.iter("Chord"):
-            for note in chord.findall("Note"):
-                pitch_elem = note.find("pitch")
-                if pitch_elem is not None and pitch_elem.text:
-                    midi_pitch = int(pitch_elem.text)
-                    pitch_name = get_pitch_name(midi_pitch)
-                    pitches.append(pitch_name)
-                    if debug and len(pitches) <= 5:
-                        print(f"Found note (Chord/Note/pitch): {pitch_name} (MIDI: {midi_pitch})")
-
-        if not pitches:
-            for note in root.iter("Note"):
-                pitch_elem = note.find("pitch")
-                if pitch_elem is not None and pitch_elem.text:
-                    midi_pitch = int(pitch_elem.text)
-                    pitch_name = get_pitch_name(midi_pitch)
-                    pitches.append(pitch_name)
-                    if debug and len(pitches) <= 5:
-                        print(f"Found note (Note/pitch): {pitch_name} (MIDI: {midi_pitch})")
-
-        if not pitches:
-            ns = {"m": "http://www.musescore.org/mscx"}
-            for note in root.findall(".//m:Note", ns):
-                pitch_elem = note.find("m:pitch", ns)
-                if pitch_elem is not None and pitch_elem.text:
-                    midi_pitch = int(pitch_elem.text)
-                    pitch_name = get_pitch_name(midi_pitch)
-                    pitches.append(pitch_name)
+        pitches = _pitch_names(midi_pitches)
 
         if debug:
+            for pitch_name in pitches[:5]:
+                print(f"Found note: {pitch_name}")
             print(f"\n{'=' * 50}")
             if pitches:
                 print(f"Successfully extracted {len(pitches)} pitches!")
             else:
                 print("No pitches found. Checking for Note elements...")
-                note_count = len(list(root.iter("Note")))
-                chord_count = len(list(root.iter("Chord")))
-                print(f"Found {note_count} Note elements")
-                print(f"Found {chord_count} Chord elements")
+                print(f"Found {counts['notes']} Note elements")
+                print(f"Found {counts['chords']} Chord elements")
 
         if pitches:
-            output_dir = os.path.normpath(str(OUTPUT_DIR))
-            os.makedirs(output_dir, exist_ok=True)
-
-            base_name = os.path.splitext(os.path.basename(mscx_file_path))[0]
-            filename = base_name + "_pitches.txt"
-            output_file_path = os.path.normpath(os.path.join(output_dir, filename))
-
-            with open(output_file_path, "w", encoding="utf-8") as f:
-                for pitch in pitches:
-                    f.write(pitch + "\n")
+            _ensure_output_dir()
+            output_file_path = _output_path(mscx_file_path)
+            _write_pitch_file(output_file_path, midi_pitches)
 
             print(f"Extracted {len(pitches)} pitches to: {output_file_path}")
 
@@ -121,32 +196,137 @@ def extract_pitches_from_mscx(mscx_file_path, output_file_path=None, debug=False
         return None
 
 
+def extract_both(mscx_file_path):
+    """Write both the pitch list and a MIDI file from a single parse of the score.
+
+    Pitch names come from the same chord walk as the MIDI export, in score order.
+    Returns ``(pitches, midi_path)``.
+    """
+    notes = load_score_notes(mscx_file_path)
+    midi_pitches = [pitch for _, pitch, _ in notes]
+    pitches = _pitch_names(midi_pitches)
+
+    if pitches:
+        _ensure_output_dir()
+        _write_pitch_file(_output_path(mscx_file_path), midi_pitches)
+
+    midi_path = write_midi_notes(notes, midi_output_path(mscx_file_path))
+    return pitches, midi_path
+
+
+def extract_pitches_batch(paths, max_workers=None):
+    """Extract pitches from several scores in parallel worker processes.
+
+    Returns a dict mapping each path to its pitch list (None on failure).
+    """
+    paths = [str(path) for path in paths]
+    if len(paths) <= 1:
+        return {path: extract_pitches_from_mscx(path) for path in paths}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(extract_pitches_from_mscx, paths)))
+
+
+def _run_batch(directory, max_workers=None, midi=False):
+    """Extract every score in ``directory`` (as pitch text, or MIDI) and print a short summary."""
+    score_dir = Path(directory)
+    try:
+        # DirEntry.is_file() is answered from the directory listing on most platforms.
+        with os.scandir(score_dir) as entries:
+            paths = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.lower().endswith((".mscx", ".mscz")) and entry.is_file()
+            )
+    except (NotADirectoryError, FileNotFoundError):
+        print(f"\nError: Not a directory: {score_dir}")
+        return
+
+    if not paths:
+        print(f"\nNo .mscx or .mscz files found in: {score_dir}")
+        return
+
+    print(f"Processing {len(paths)} scores from: {score_dir}\n")
+    extract_batch = extract_midi_batch if midi else extract_pitches_batch
+    results = extract_batch(paths, max_workers=max_workers)
+    failed = [path for path, result in results.items() if result is None]
+
+    print(f"\n{'-' * 60}")
+    print(f"Batch extraction complete: {len(results) - len(failed)} of {len(results)} scores processed.")
+    for path in failed:
+        print(f"  Failed: {path}")
+
+
 def main():
     """Interactive main function."""
+    parser = argparse.ArgumentParser(description="MuseScore Pitch Extractor")
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Extract pitches from every .mscx/.mscz file in DIR using parallel workers.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for --batch (default: CPU count).",
+    )
+    parser.add_argument(
+        "--midi",
+        action="store_true",
+        help="With --batch, export MIDI files instead of pitch lists.",
+    )
+    args = parser.parse_args()
+
+    if not args.batch and (args.midi or args.workers is not None):
+        parser.error("--midi and --workers require --batch")
+
+    if args.batch:
+        _run_batch(args.batch, max_workers=args.workers, midi=args.midi)
+        return
+
     print("-" * 60)
     print("MuseScore Pitch Extractor")
     print("-" * 60)
     print()
 
-    file_path = input("Enter the path to MuseScore file (.mscx or .mscz): ").strip()
+    file_path = input("Enter the path to MuseScore file (.mscx or .mscz) or a folder of scores: ").strip()
     file_path = file_path.strip('"').strip("'")
 
+    if os.path.isdir(file_path):
+        print("\nOutput format:")
+        print("1. Text (pitch names)")
+        print("2. MIDI")
+        format_choice = input("Select format (1 or 2, default: 1): ").strip() or "1"
+        print()
+        _run_batch(file_path, midi=format_choice == "2")
+        return
+
     if not os.path.exists(file_path):
         print(f"\nError: File not found: {file_path}")
         return
 
-    if not (file_path.endswith(".mscx") or file_path.endswith(".mscz")):
+    if not file_path.lower().endswith((".mscx", ".mscz")):
         print("\nWarning: File doesn't have .mscx or .mscz extension...")
 
     print("\nOutput format:")
     print("1. Text (pitch names)")
     print("2. MIDI")
-    format_choice = input("Select format (1 or 2, default: 1): ").strip() or "1"
+    print("3. Both")
+    format_choice = input("Select format (1, 2 or 3, default: 1): ").strip() or "1"
 
     print(f"\nProcessing: {file_path}\n")
 
     try:
-        if format_choice == "2":
+        if format_choice == "3":
+            pitches, midi_path = extract_both(file_path)
+            print(f"\n{'-' * 60}")
+            print("Extraction complete!")
+            print(f"Total notes extracted: {len(pitches)}")
+            if pitches:
+                print(f"Notes saved to: {_output_path(file_path)}")
+            print(f"MIDI file saved to: {midi_path}")
+        elif format_choice == "2":
             midi_path = extract_midi_from_mscx(file_path)
             if midi_path:
                 print(f"\n{'-' * 60}")
@@ -166,9 +346,7 @@ def main():
                 if len(pitches) > 20:
                     print(f"  ... and {len(pitches) - 20} more")
 
-                base_name = os.path.splitext(os.path.basename(file_path))[0]
-                output_file = os.path.join(str(OUTPUT_DIR), base_name + "_pitches.txt")
-                print(f"\nNotes saved to: {output_file}")
+                print(f"\nNotes saved to: {_output_path(file_path)}")
             else:
                 print("\nNo pitches extracted.")
     except Exception as e:
@@ -7,19 +7,13 @@ from pathlib import Path
 if __package__ is None or __package__ == "":
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from music_clipboard.extract.pitchnames import get_pitch_name
+from music_clipboard.extract.xmlstream import find_score_member
 from music_clipboard.platform.runtime import output_dirs
 
 OUTPUT_DIR = output_dirs()[0]
 
 
-def get_pitch_name(pitch_value):
-    """Convert MIDI pitch number to note name (e.g., 60 -> C4)."""
-    pitch_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    note = pitch_value % 12
-    octave = (pitch_value // 12) - 1
-    return f"{pitch_names[note]}{octave}"
-
-
 def get_division(root):
     """Get the Division value from the score (ticks per quarter note)."""
     division = 480
@@ -78,21 +72,12 @@ def extract_pitches_with_position_from_mscx(mscx_file_path, output_file_path=Non
                        If None, extracts all measures
     """
     try:
-        if mscx_file_path.endswith(".mscz"):
+        if mscx_file_path.lower().endswith(".mscz"):
             print("Detected .mscz file, extracting...")
             with zipfile.ZipFile(mscx_file_path, "r") as zip_ref:
-                file_list = zip_ref.namelist()
-                score_file = None
-                for name in file_list:
-                    if name.endswith(".mscx") or ("." not in name and not name.endswith("/")):
-                        score_file = name
-                        break
-
-                if score_file is None:
-                    score_file = file_list[0]
-
-                print(f"Reading {score_file} from archive...")
-                with zip_ref.open(score_file) as f:
+                score_info = find_score_member(zip_ref)
+                print(f"Reading {score_info.filename} from archive...")
+                with zip_ref.open(score_info) as f:
                     tree = ET.parse(f)
                     root = tree.getroot()
         else:
@@ -186,9 +171,8 @@ def extract_pitches_with_position_from_mscx(mscx_file_path, output_file_path=Non
                 else:
                     duration = division
 
-                for note in chord.findall("Note"):
-                    pitch_elem = note.find("pitch")
-                    if pitch_elem is not None and pitch_elem.text:
+                for pitch_elem in chord.iterfind("Note/pitch"):
+                    if pitch_elem.text:
                         midi_pitch = int(pitch_elem.text)
                         pitch_name = get_pitch_name(midi_pitch)
 
@@ -204,10 +188,6 @@ def extract_pitches_with_position_from_mscx(mscx_file_path, output_file_path=Non
                                 (pitch_name, position_str, current_tick + measure_tick)
                             )
 
-                        if debug and len(notes_with_position) <= 5:
-                            tick_val = chord_tick or (current_tick + measure_tick)
-                            print(f"Found note: {pitch_name} at {position_str} (tick: {tick_val})")
-
                 if duration_elem is not None and duration_elem.text:
                     measure_tick += int(duration_elem.text)
                 else:
@@ -224,8 +204,6 @@ def extract_pitches_with_position_from_mscx(mscx_file_path, output_file_path=Non
                         position_str = f"M{current_measure_num}:{beat:.2f}"
 
                         notes_with_position.append((pitch_name, position_str, current_tick + measure_tick))
-                        if debug and len(notes_with_position) <= 5:
-                            print(f"Found note: {pitch_name} at {position_str}")
 
                         measure_tick += division
 
@@ -233,33 +211,29 @@ def extract_pitches_with_position_from_mscx(mscx_file_path, output_file_path=Non
 
         if not notes_with_position:
             print("Trying fallback approach...")
-            for chord in root.iter("Chord"):
-                for note in chord.findall("Note"):
-                    pitch_elem = note.find("pitch")
-                    if pitch_elem is not None and pitch_elem.text:
-                        midi_pitch = int(pitch_elem.text)
-                        pitch_name = get_pitch_name(midi_pitch)
-                        notes_with_position.append((pitch_name, "M?:?", None))
-                        if debug and len(notes_with_position) <= 5:
-                            print(f"Found note (fallback): {pitch_name}")
-
-        if not notes_with_position:
-            ns = {"m": "http://www.musescore.org/mscx"}
-            for note in root.findall(".//m:Note", ns):
-                pitch_elem = note.find("m:pitch", ns)
-                if pitch_elem is not None and pitch_elem.text:
-                    midi_pitch = int(pitch_elem.text)
-                    pitch_name = get_pitch_name(midi_pitch)
+            # One walk covers both plain and namespaced (MuseScore 2) scores.
+            for pitch_elem in root.iterfind(".//{*}Note/{*}pitch"):
+                if pitch_elem.text:
+                    pitch_name = get_pitch_name(int(pitch_elem.text))
                     notes_with_position.append((pitch_name, "M?:?", None))
 
         if debug:
+            for pitch_name, position_str, tick in notes_with_position[:5]:
+                if tick is None:
+                    print(f"Found note (fallback): {pitch_name}")
+                else:
+                    print(f"Found note: {pitch_name} at {position_str} (tick: {tick})")
             print(f"\n{'=' * 50}")
             if notes_with_position:
                 print(f"Successfully extracted {len(notes_with_position)} notes with positions!")
             else:
                 print("No notes found. Checking for Note elements...")
-                note_count = len(list(root.iter("Note")))
-                chord_count = len(list(root.iter("Chord")))
+                note_count = chord_count = 0
+                for elem in root.iter():
+                    if elem.tag == "Note":
+                        note_count += 1
+                    elif elem.tag == "Chord":
+                        chord_count += 1
                 print(f"Found {note_count} Note elements")
                 print(f"Found {chord_count} Chord elements")
 
@@ -276,12 +250,12 @@ def extract_pitches_with_position_from_mscx(mscx_file_path, output_file_path=Non
                 print(f"DEBUG: Filename: {filename}")
                 print(f"DEBUG: Full output path: {output_file_path}")
 
+            lines = [
+                f"{pitch}\t{position}\t(tick: {tick})\n" if tick is not None else f"{pitch}\t{position}\n"
+                for pitch, position, tick in notes_with_position
+            ]
             with open(output_file_path, "w", encoding="utf-8") as f:
-                for pitch, position, tick in notes_with_position:
-                    if tick is not None:
-                        f.write(f"{pitch}\t{position}\t(tick: {tick})\n")
-                    else:
-                        f.write(f"{pitch}\t{position}\n")
+                f.write("".join(lines))
 
             print(f"Extracted {len(notes_with_position)} notes to: {output_file_path}")
             return notes_with_position, output_file_path
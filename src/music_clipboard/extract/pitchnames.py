@@ -0,0 +1,10 @@
+_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+# Note name for every MIDI pitch (0-127), e.g. PITCH_TABLE[60] == "C4".
+PITCH_TABLE = tuple(f"{_NAMES[i % 12]}{(i // 12) - 1}" for i in range(128))
+
+
+def get_pitch_name(pitch_value):
+    """Convert MIDI pitch number to note name (e.g., 60 -> C4)."""
+    if 0 <= pitch_value < 128:
+        return PITCH_TABLE[pitch_value]
+    return f"{_NAMES[pitch_value % 12]}{(pitch_value // 12) - 1}"
@@ -0,0 +1,53 @@
+try:
+    from lxml import etree as ET
+
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    LXML_AVAILABLE = False
+
+
+def iter_end_elements(source, tags=None):
+    """Stream ``source``, yielding elements whose tag is in ``tags`` as each one closes.
+
+    ``tags=None`` yields every element. On lxml the filtering happens in C; the stdlib
+    fallback filters in Python.
+    """
+    if LXML_AVAILABLE:
+        options = {} if tags is None else {"tag": tuple(tags)}
+        for _, elem in ET.iterparse(source, events=("end",), huge_tree=True, **options):
+            yield elem
+        return
+
+    if tags is None:
+        for _, elem in ET.iterparse(source, events=("end",)):
+            yield elem
+        return
+
+    tags = frozenset(tags)
+    for _, elem in ET.iterparse(source, events=("end",)):
+        if elem.tag in tags:
+            yield elem
+
+
+def prune(elem):
+    """Drop an already-processed element and, on lxml, its processed siblings."""
+    elem.clear()
+    if LXML_AVAILABLE:
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def find_score_member(zip_ref):
+    """Return the ``ZipInfo`` of the main score in an open .mscz archive.
+
+    One pass over the central directory: the largest top-level .mscx wins, since part
+    excerpts live under Excerpts/.
+    """
+    infos = zip_ref.infolist()
+    candidates = [i for i in infos if i.filename.endswith(".mscx")]
+    if not candidates:
+        return infos[0]
+    top_level = [i for i in candidates if "/" not in i.filename]
+    return max(top_level or candidates, key=lambda i: i.file_size)
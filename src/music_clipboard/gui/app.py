@@ -1,8 +1,16 @@
 import argparse
+import asyncio
+import atexit
+import collections
+import hashlib
+import importlib
+import importlib.util
 import json
 import os
 import queue
+import select
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
@@ -11,21 +19,52 @@ import time
 import tkinter as tk
 import urllib.error
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext, simpledialog, ttk
 
 if __package__ is None or __package__ == "":
     sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from music_clipboard.platform.runtime import IS_MACOS, IS_WINDOWS, default_hotkey, output_dirs
+from music_clipboard.platform.keystrokes import post_hotkey
+from music_clipboard.platform.osascript import OsascriptSession
+from music_clipboard.platform.processes import list_process_names
+from music_clipboard.platform.runtime import (
+    IS_MACOS,
+    IS_WINDOWS,
+    default_hotkey,
+    gui_pid_file,
+    hotkey_socket_path,
+    output_dirs,
+)
+
+
+def _module_available(name):
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# pyautogui, keyboard and psutil are slow to import and only needed once automation
+# actually runs, so they are loaded on first use via _load_optional().
+_LAZY_MODULES = {}
+
+
+def _load_optional(name):
+    """Import an optional automation module the first time it is needed."""
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        if name == "pyautogui":
+            module.FAILSAFE = False
+        _LAZY_MODULES[name] = module
+    return module
+
 
 # Try to import automation libraries
-try:
-    import pyautogui
-    pyautogui.FAILSAFE = False
-    PYAUTOGUI_AVAILABLE = True
-except ImportError:
-    PYAUTOGUI_AVAILABLE = False
+PYAUTOGUI_AVAILABLE = _module_available("pyautogui")
 
 try:
     from pywinauto import Application
@@ -40,11 +79,7 @@ try:
 except ImportError:
     WIN32_AVAILABLE = False
 
-try:
-    import keyboard
-    KEYBOARD_AVAILABLE = True
-except ImportError:
-    KEYBOARD_AVAILABLE = False
+KEYBOARD_AVAILABLE = _module_available("keyboard")
 
 if IS_MACOS:
     try:
@@ -57,16 +92,50 @@ else:
     pynput_keyboard = None
     PYNPUT_AVAILABLE = False
 
+if IS_MACOS:
+    try:
+        from fsevents import Observer as FSEventsObserver
+        from fsevents import Stream as FSEventsStream
+        FSEVENTS_AVAILABLE = True
+    except ImportError:
+        FSEVENTS_AVAILABLE = False
+else:
+    FSEVENTS_AVAILABLE = False
+
 try:
-    import psutil
-    PSUTIL_AVAILABLE = True
+    import watchfiles
+    WATCHFILES_AVAILABLE = True
 except ImportError:
-    PSUTIL_AVAILABLE = False
+    WATCHFILES_AVAILABLE = False
+
+PSUTIL_AVAILABLE = _module_available("psutil")
 
-CONFIG_FILE = Path(os.path.expanduser("~")) / ".musescore_pitch_extractor_prefs"
+HOME_DIR = os.path.expanduser("~")
+DOCUMENTS_DIR = os.path.join(HOME_DIR, "Documents")
+DEFAULT_WATCH_FOLDER = os.path.join(DOCUMENTS_DIR, "MuseScore4", "Scores")
+CONFIG_FILE = Path(HOME_DIR) / ".musescore_pitch_extractor_prefs"
 HOTKEY_REQUEST_FILE = Path(tempfile.gettempdir()) / "musescore_hotkey_request.txt"
+GUI_PID_FILE = gui_pid_file()
+HOTKEY_SOCKET_PATH = hotkey_socket_path()
 WATCHED_SCORE_EXTENSIONS = (".mscx", ".mscz", ".mid", ".midi")
-EXTRACTABLE_SCORE_EXTENSIONS = (".mscx", ".mscz")
+_WATCHED_SUFFIXES = frozenset(WATCHED_SCORE_EXTENSIONS)
+EXTRACTABLE_SCORE_EXTENSIONS = frozenset((".mscx", ".mscz"))
+MIDI_INPUT_EXTENSIONS = frozenset((".mid", ".midi"))
+LOG_FLUSH_INTERVAL_MS = 50
+# Oldest log lines are dropped beyond this, so long watch sessions don't bloat the Text widget.
+LOG_MAX_LINES = 5000
+# Preference changes within this window are written to disk once.
+PREFERENCES_SAVE_DELAY_MS = 500
+WATCH_POLL_INTERVAL = 1.0
+# Rescan delay while a new score is still being written; it is accepted once its size
+# and mtime match across two scans.
+WATCH_SETTLE_SAMPLE_INTERVAL = 0.05
+# With a filesystem event source, idle rescans are only a safety net for missed events.
+WATCH_IDLE_RESCAN_INTERVAL = 30.0
+# Folders modified this recently are relisted even if their mtime looks unchanged.
+WATCH_MTIME_GRANULARITY_NS = 2_000_000_000
+# How long closing the window waits for cancelled background tasks to run their cleanup.
+BACKGROUND_SHUTDOWN_TIMEOUT = 2.0
 
 OUTPUT_DIR, MIDI_OUTPUT_DIR = output_dirs()
 
@@ -100,6 +169,17 @@ PROGRAM_PROFILES = {
 }
 
 PROGRAM_ORDER = ["musescore", "logic_pro"]
+# Detected macOS process name per program: program_id -> (process_name, expires_at).
+_PROCESS_NAME_CACHE = {}
+PROCESS_NAME_TTL = 3.0
+PROCESS_NAME_CONFIRMED_TTL = 30.0
+# Extraction outputs remembered per unchanged score, so repeat triggers skip the parser.
+EXTRACT_CACHE_SIZE = 64
+# Compiled copies of the AppleScripts we run, keyed by a hash of their source.
+COMPILED_SCRIPT_DIR = Path(tempfile.gettempdir()) / "music_clipboard_scpt"
+_COMPILED_SCRIPTS = {}
+# Persistent osascript used by run_applescript; started on first use (macOS only).
+_OSASCRIPT_SESSION = OsascriptSession()
 TAB_CLIPBOARD = "clipboard"
 TAB_AI_EDITING = "ai_editing"
 TAB_SETTINGS = "settings"
@@ -244,11 +324,89 @@ def _hotkey_to_windows_pywinauto(normalized_hotkey):
     return prefix + key_token
 
 
+def _scan_watch_folder(folder, output_ext):
+    """Read ``folder`` once, splitting it into watched score files and output-type files.
+
+    Scores are returned as a ``{name: DirEntry}`` dict so callers can stat them lazily.
+    """
+    score_files = {}
+    output_files = set()
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            suffix = os.path.splitext(entry.name)[1].lower()
+            if suffix in _WATCHED_SUFFIXES:
+                if entry.is_file():
+                    score_files[entry.name] = entry
+            elif suffix == output_ext:
+                output_files.add(entry.path)
+    return score_files, output_files
+
+
+def _reveal_command(file_path):
+    """Command that shows ``file_path`` in the system file manager."""
+    if IS_MACOS:
+        return ["open", "-R", file_path]
+    if IS_WINDOWS:
+        return ["explorer", "/select,", os.path.normpath(file_path)]
+    return ["xdg-open", os.path.dirname(file_path)]
+
+
+def _launch_detached(command):
+    """Start ``command`` without waiting for it, so the Tk thread never blocks."""
+    subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _compiled_applescript(script):
+    """Path of a compiled .scpt for ``script``, compiling it with osacompile on first use.
+
+    Returns None if compilation is unavailable, so callers can fall back to ``osascript -e``.
+    """
+    if not IS_MACOS:
+        return None
+    compiled = _COMPILED_SCRIPTS.get(script)
+    if compiled is not None:
+        return compiled or None
+
+    digest = hashlib.sha1(script.encode("utf-8")).hexdigest()
+    path = COMPILED_SCRIPT_DIR / f"{digest}.scpt"
+    if not path.exists():
+        try:
+            COMPILED_SCRIPT_DIR.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f"{digest}.{os.getpid()}.scpt")
+            result = subprocess.run(
+                ["osacompile", "-o", str(partial), "-e", script],
+                capture_output=True,
+                timeout=10,
+            )
+            if result.returncode != 0:
+                _COMPILED_SCRIPTS[script] = ""
+                return None
+            os.replace(partial, path)
+        except (OSError, subprocess.TimeoutExpired):
+            _COMPILED_SCRIPTS[script] = ""
+            return None
+
+    _COMPILED_SCRIPTS[script] = str(path)
+    return str(path)
+
+
 def run_applescript(script):
     """Run an AppleScript command and return the result."""
+    result = _OSASCRIPT_SESSION.run(script)
+    if result is not None:
+        return result
+
+    compiled = _compiled_applescript(script)
     try:
+        # Uncompiled source goes through stdin, which has no argv size limit.
         result = subprocess.run(
-            ["osascript", "-e", script],
+            ["osascript", compiled] if compiled else ["osascript", "-"],
+            input=None if compiled else script,
             capture_output=True,
             text=True,
             timeout=10,
@@ -263,64 +421,117 @@ def run_applescript(script):
         return False, "", str(e)
 
 
-def find_musescore_window_macos():
-    """Find MuseScore window on macOS using AppleScript with multiple fallback methods."""
-    scripts = [
-        """
-        tell application "System Events"
-            try
-                set museScoreProcess to first process whose name is "mscore"
-                return name of museScoreProcess
-            on error
-                return ""
-            end try
-        end tell
-        """,
-        """
-        tell application "System Events"
+def _cached_process_name(program_id):
+    entry = _PROCESS_NAME_CACHE.get(program_id)
+    if entry and time.monotonic() < entry[1]:
+        return entry[0]
+    return None
+
+
+def _remember_process_name(program_id, process_name, ttl=PROCESS_NAME_TTL):
+    _PROCESS_NAME_CACHE[program_id] = (process_name, time.monotonic() + ttl)
+
+
+def _forget_process_name(program_id):
+    _PROCESS_NAME_CACHE.pop(program_id, None)
+
+
+def _keystroke_command(normalized_hotkey):
+    """AppleScript ``keystroke`` command for a normalized hotkey such as ``cmd+shift+s``."""
+    modifiers, key = _split_normalized_hotkey(normalized_hotkey)
+    key_to_send = " " if key == "space" else key
+    modifier_tokens = []
+    for mod in modifiers:
+        if mod == "cmd":
+            modifier_tokens.append("command down")
+        elif mod == "ctrl":
+            modifier_tokens.append("control down")
+        elif mod == "alt":
+            modifier_tokens.append("option down")
+        elif mod == "shift":
+            modifier_tokens.append("shift down")
+
+    if modifier_tokens:
+        using_clause = " using {" + ", ".join(modifier_tokens) + "}"
+    else:
+        using_clause = ""
+    return f'keystroke "{key_to_send}"{using_clause}'
+
+
+def _applescript_list(values):
+    """Format Python strings as an AppleScript list literal."""
+    return "{" + ", ".join(f'"{value}"' for value in values) + "}"
+
+
+def _find_process_script(process_names, contains_keywords):
+    """Build one AppleScript that tries exact process names, then a substring scan."""
+    contains_test = " or ".join(f'procText contains "{keyword}"' for keyword in contains_keywords) or "false"
+    return f"""
+    tell application "System Events"
+        repeat with candidateName in {_applescript_list(process_names)}
             try
-                set museScoreProcess to first process whose name is "MuseScore 4"
-                return name of museScoreProcess
-            on error
-                return ""
+                return name of first process whose name is (candidateName as text)
             end try
-        end tell
-        """,
-        """
-        tell application "System Events"
+        end repeat
+        repeat with procName in (name of every process)
+            set procText to procName as text
+            if {contains_test} then return procText
+        end repeat
+        return ""
+    end tell
+    """
+
+
+def _activate_process_script(app_names, process_names):
+    """Build one AppleScript that activates the first reachable app, else raises its process."""
+    return f"""
+    repeat with appName in {_applescript_list(app_names)}
+        try
+            tell application (appName as text) to activate
+            return "true"
+        end try
+    end repeat
+    tell application "System Events"
+        repeat with candidateName in {_applescript_list(process_names)}
             try
-                set museScoreProcess to first process whose name contains "MuseScore"
-                return name of museScoreProcess
-            on error
-                return ""
+                set frontmost of (first process whose name is (candidateName as text)) to true
+                return "true"
             end try
-        end tell
-        """,
-        """
-        tell application "System Events"
-            set processList to name of every process
-            repeat with procName in processList
-                if procName contains "MuseScore" or procName is "mscore" then
-                    return procName
-                end if
-            end repeat
-            return ""
-        end tell
-        """,
-    ]
+        end repeat
+    end tell
+    return "false"
+    """
 
-    for script in scripts:
-        success, output, error = run_applescript(script)
-        if success and output and output.strip():
-            return True, output.strip(), ""
 
-    if PSUTIL_AVAILABLE:
+def find_musescore_window_macos():
+    """Find MuseScore window on macOS with a single AppleScript call."""
+    cached_name = _cached_process_name("musescore")
+    if cached_name:
+        return True, cached_name, ""
+
+    profile = PROGRAM_PROFILES["musescore"]
+    script = _find_process_script(profile["mac_process_names"], profile["mac_contains"])
+    success, output, _ = run_applescript(script)
+    if success and output.strip():
+        _remember_process_name("musescore", output.strip())
+        return True, output.strip(), ""
+
+    process_names = list_process_names()
+    if process_names is not None:
+        for proc_name in process_names:
+            proc_lower = proc_name.lower()
+            if "musescore" in proc_lower or proc_lower == "mscore":
+                _remember_process_name("musescore", proc_name)
+                return True, proc_name, ""
+    elif PSUTIL_AVAILABLE:
         try:
+            psutil = _load_optional("psutil")
             for proc in psutil.process_iter(["pid", "name"]):
                 try:
                     proc_name = proc.info.get("name") or ""
                     proc_lower = proc_name.lower()
                     if "musescore" in proc_lower or proc_lower == "mscore":
+                        _remember_process_name("musescore", proc_name)
                         return True, proc_name, ""
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
@@ -331,183 +542,47 @@ def find_musescore_window_macos():
 
 
 def activate_musescore_window_macos():
-    """Activate MuseScore window on macOS using AppleScript with multiple fallback methods."""
-    scripts = [
-        """
-        tell application "System Events"
-            try
-                set museScoreProcess to first process whose name is "mscore"
-                set frontmost of museScoreProcess to true
-            on error
-                return false
-            end try
-        end tell
-        """,
-        """
-        tell application "MuseScore 4"
-            activate
-        end tell
-        """,
-        """
-        tell application "MuseScore 3"
-            activate
-        end tell
-        """,
-        """
-        tell application "MuseScore"
-            activate
-        end tell
-        """,
-        """
-        tell application "System Events"
-            try
-                set museScoreProcess to first process whose name is "mscore"
-                set frontmost of museScoreProcess to true
-            on error
-                try
-                    set museScoreProcess to first process whose name is "MuseScore 4"
-                    set frontmost of museScoreProcess to true
-                on error
-                    set museScoreProcess to first process whose name contains "MuseScore"
-                    set frontmost of museScoreProcess to true
-                end try
-            end try
-        end tell
-        """,
-        """
-        tell application "System Events"
-            set museScoreProcess to first process whose name contains "MuseScore"
-            set frontmost of museScoreProcess to true
-        end tell
-        """,
-    ]
-
-    for script in scripts:
-        success, output, error = run_applescript(script)
-        if success:
-            return True, output, error
+    """Activate MuseScore window on macOS with a single AppleScript call."""
+    profile = PROGRAM_PROFILES["musescore"]
+    script = _activate_process_script(profile["mac_app_names"], profile["mac_process_names"])
+    success, output, error = run_applescript(script)
+    if success and output.strip().lower() == "true":
+        return True, output, error
 
     return False, "", "Could not activate MuseScore"
 
 
 def send_shortcut_macos():
-    """Send Cmd+Shift+S shortcut on macOS with multiple fallback methods."""
-    scripts = [
-        """
-        tell application "System Events"
-            try
-                tell process "mscore"
-                    keystroke "s" using {command down, shift down}
-                    return true
-                end tell
-            on error
-                return false
-            end try
-        end tell
-        """,
-        """
-        tell application "System Events"
-            try
-                tell process "MuseScore 4"
-                    keystroke "s" using {command down, shift down}
-                    return true
-                end tell
-            on error
-                return false
-            end try
-        end tell
-        """,
-        """
-        tell application "System Events"
-            try
-                tell process "MuseScore 3"
-                    keystroke "s" using {command down, shift down}
-                    return true
-                end tell
-            on error
-                return false
-            end try
-        end tell
-        """,
-        """
-        tell application "System Events"
-            try
-                tell process "MuseScore"
-                    keystroke "s" using {command down, shift down}
-                    return true
-                end tell
-            on error
-                return false
-            end try
-        end tell
-        """,
-        """
-        tell application "System Events"
-            try
-                set museScoreProcess to first process whose name is "mscore"
-                tell museScoreProcess
-                    keystroke "s" using {command down, shift down}
-                end tell
-                return true
-            on error
-                return false
-            end try
-        end tell
-        """,
-        """
-        tell application "System Events"
-            try
-                set museScoreProcess to first process whose name contains "MuseScore"
-                tell museScoreProcess
-                    keystroke "s" using {command down, shift down}
-                end tell
-                return true
-            on error
-                return false
-            end try
-        end tell
-        """,
-        """
-        tell application "System Events"
+    """Send Cmd+Shift+S shortcut on macOS with a single AppleScript call."""
+    profile = PROGRAM_PROFILES["musescore"]
+    script = f"""
+    tell application "System Events"
+        repeat with candidateName in {_applescript_list(profile["mac_process_names"])}
             try
-                set museScoreProcess to first process whose name is "mscore"
-                tell museScoreProcess
-                    keystroke "s" using {command down, shift down}
+                tell process (candidateName as text)
+                    keystroke "s" using {{command down, shift down}}
                 end tell
-                return true
-            on error
-                try
-                    set museScoreProcess to first process whose name is "MuseScore 4"
-                    tell museScoreProcess
-                        keystroke "s" using {command down, shift down}
-                    end tell
-                    return true
-                on error
-                    try
-                        set museScoreProcess to first process whose name contains "MuseScore"
-                        tell museScoreProcess
-                            keystroke "s" using {command down, shift down}
-                        end tell
-                        return true
-                    on error
-                        return false
-                    end try
-                end try
+                return "true"
             end try
-        end tell
-        """,
-    ]
-
-    for script in scripts:
-        success, output, error = run_applescript(script)
-        if success:
-            return True, output, error
+        end repeat
+        try
+            tell (first process whose name contains "MuseScore")
+                keystroke "s" using {{command down, shift down}}
+            end tell
+            return "true"
+        end try
+        return "false"
+    end tell
+    """
+    success, output, error = run_applescript(script)
+    if success and output.strip().lower() == "true":
+        return True, output, error
 
     return False, "", "Could not send keyboard shortcut to MuseScore"
 
 
 class MuseScoreExtractorApp:
-    def __init__(self, root, trigger_on_start=False, disable_global_hotkey=False):
+    def __init__(self, root, trigger_on_start=False, disable_global_hotkey=False, debug_mode=False):
         self.root = root
         self.root.title("MuseScore Pitch Extractor")
         self.root.geometry("800x700")
@@ -525,23 +600,41 @@ class MuseScoreExtractorApp:
 
         self.trigger_on_start = trigger_on_start
         self.disable_global_hotkey = disable_global_hotkey
+        self.debug_mode = debug_mode
 
         self.watch_folder = tk.StringVar()
         self.watching = False
-        self.watch_thread = None
+        self._watch_future = None
+        self._watch_wakeup = None
+        self._watch_fs_events = False
+        # Stop callable of the running watch's filesystem event source, if any.
+        self._stop_fs_watcher = None
+        self._extract_cache = collections.OrderedDict()
+        # Names of watched scores already seen, relative to the watched folder.
         self.processed_files = set()
+        # New scores seen mid-write: name -> (st_mtime_ns, st_size) at the last scan.
+        self._pending_watch_files = {}
         self.seen_output_type_files = set()
         self._clear_confirm_queue = queue.Queue()
         self.output_format = tk.StringVar(value="Text")
+        # Mirrored for the watch loop so it doesn't call into Tk from another thread every tick.
+        self._watch_output_ext_value = ".txt"
+        self.output_format.trace_add("write", self._on_output_format_changed)
         self.last_extracted_file = None
         self.delete_previous_var = tk.BooleanVar(value=True)
         self.output_views = []
+        self._log_queue = queue.SimpleQueue()
+        self._log_flush_after_id = None
         self.open_location_buttons = []
+        self._saved_preferences_payload = None
+        self._save_after_id = None
         self.preferences = self.load_preferences()
         self.visible_programs = list(self.preferences.get("visible_programs", PROGRAM_ORDER))
         self.custom_hotkeys = dict(self.preferences.get("custom_hotkeys", {}))
-        self._hotkey_monitor_stop = threading.Event()
+        self._hotkey_monitor_future = None
         self._last_hotkey_request = 0
+        self._save_trigger_running = False
+        self._hotkey_socket = None
         self._pynput_listener = None
         self._last_accepted_watch_event_ts = None
         self._watch_gate_lock = threading.Lock()
@@ -549,8 +642,14 @@ class MuseScoreExtractorApp:
         self._ai_export_lock = threading.Lock()
         self._ai_export_in_progress = set()
         self.ai_flow_var = tk.StringVar(value=AI_FLOW_LABELS[AI_FLOW_CLAUDE])
+        self._start_background_loop()
+        if IS_MACOS:
+            # Warm the persistent osascript so the first hotkey doesn't pay its startup.
+            _OSASCRIPT_SESSION.start()
 
         self.create_widgets()
+        # Started here, on the Tk thread; log() itself never touches Tk.
+        self._flush_log()
         self.apply_saved_preferences()
         self.setup_hotkey_request_monitor()
         self.register_global_hotkey()
@@ -577,6 +676,7 @@ class MuseScoreExtractorApp:
             raw_content = CONFIG_FILE.read_text(encoding="utf-8")
         except Exception:
             return defaults
+        self._saved_preferences_payload = raw_content
 
         try:
             loaded = json.loads(raw_content)
@@ -678,23 +778,43 @@ class MuseScoreExtractorApp:
             "custom_hotkeys": dict(self.custom_hotkeys),
             "active_tab": self._get_active_tab_id(),
         }
+        payload = json.dumps(self.preferences, indent=2)
+        if payload == self._saved_preferences_payload:
+            return
         try:
             CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.preferences, f, indent=2)
+            CONFIG_FILE.write_text(payload, encoding="utf-8")
+            self._saved_preferences_payload = payload
         except Exception as exc:
             self.log(f"Warning: Could not save preferences: {exc}")
 
+    def _schedule_save(self):
+        """Save preferences shortly, collapsing a burst of changes into one write."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(PREFERENCES_SAVE_DELAY_MS, self._run_scheduled_save)
+
+    def _run_scheduled_save(self):
+        self._save_after_id = None
+        self.save_preferences()
+
+    def _cancel_scheduled_save(self):
+        if self._save_after_id is not None:
+            try:
+                self.root.after_cancel(self._save_after_id)
+            except tk.TclError:
+                pass
+            self._save_after_id = None
+
     def apply_saved_preferences(self):
-        default_folder = os.path.join(os.path.expanduser("~"), "Documents", "MuseScore4", "Scores")
         saved_folder = self.preferences.get("watch_folder")
 
-        if saved_folder and os.path.exists(saved_folder):
+        if saved_folder and os.path.isdir(saved_folder):
             self.watch_folder.set(saved_folder)
-        elif os.path.exists(default_folder):
-            self.watch_folder.set(default_folder)
+        elif os.path.isdir(DEFAULT_WATCH_FOLDER):
+            self.watch_folder.set(DEFAULT_WATCH_FOLDER)
         else:
-            self.watch_folder.set(os.path.join(os.path.expanduser("~"), "Documents"))
+            self.watch_folder.set(DOCUMENTS_DIR)
 
         selected_program = self.preferences.get("selected_program", "musescore")
         if selected_program not in self.visible_programs and self.visible_programs:
@@ -1024,11 +1144,11 @@ class MuseScoreExtractorApp:
             program_id = self.visible_programs[0]
         self.selected_program_var.set(program_id)
         self._update_program_dependent_ui()
-        self.save_preferences()
+        self._schedule_save()
 
     def _on_tab_changed(self, _event=None):
         self._update_program_dependent_ui()
-        self.save_preferences()
+        self._schedule_save()
 
     def _on_ai_flow_changed(self, _event=None):
         self._update_program_dependent_ui()
@@ -1179,7 +1299,7 @@ class MuseScoreExtractorApp:
 
     def _ensure_midi_input_for_openai(self, file_path):
         extension = Path(file_path).suffix.lower()
-        if extension in (".mid", ".midi"):
+        if extension in MIDI_INPUT_EXTENSIONS:
             return file_path, False
 
         if extension in EXTRACTABLE_SCORE_EXTENSIONS:
@@ -1375,16 +1495,54 @@ class MuseScoreExtractorApp:
         folder = filedialog.askdirectory(title="Select Folder to Watch")
         if folder:
             self.watch_folder.set(folder)
-            self.save_preferences()
+            self._schedule_save()
 
     def log(self, message):
+        # Safe from any thread: only enqueue. The Tk thread drains the queue on a timer and
+        # writes whole batches in one insert.
+        self._log_queue.put(message)
+
+    def _log_traceback(self):
+        # Formatting walks the whole stack, so only pay for it when debugging.
+        if self.debug_mode:
+            import traceback
+
+            self.log(f"Traceback:\n{traceback.format_exc()}")
+
+    def _drain_log_queue(self):
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        return lines
+
+    def _flush_log(self):
+        """Write queued log lines to the output views, then reschedule itself (Tk thread only)."""
+        try:
+            self._write_log_lines(self._drain_log_queue())
+        finally:
+            self._log_flush_after_id = self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+
+    def _write_log_lines(self, lines):
+        if not lines:
+            return
+
+        text = "\n".join(lines) + "\n"
         targets = self.output_views if self.output_views else [self.output_text]
         for view in targets:
-            view.insert(tk.END, message + "\n")
-            view.see(tk.END)
-        self.root.update_idletasks()
+            # Only follow new output if the user hasn't scrolled up to read earlier lines.
+            at_bottom = view.yview()[1] >= 0.999
+            view.insert(tk.END, text)
+            excess = int(view.index("end-1c").split(".")[0]) - LOG_MAX_LINES
+            if excess > 0:
+                view.delete("1.0", f"{excess + 1}.0")
+            if at_bottom:
+                view.see(tk.END)
 
     def clear_output(self):
+        self._drain_log_queue()
         targets = self.output_views if self.output_views else [self.output_text]
         for view in targets:
             view.delete(1.0, tk.END)
@@ -1394,19 +1552,14 @@ class MuseScoreExtractorApp:
         if not file_path or not os.path.exists(file_path):
             return
         try:
-            if IS_MACOS:
-                subprocess.run(["open", "-R", file_path])
-            elif IS_WINDOWS:
-                subprocess.run(["explorer", "/select,", os.path.normpath(file_path)])
-            else:
-                subprocess.run(["xdg-open", os.path.dirname(file_path)])
+            _launch_detached(_reveal_command(file_path))
         except Exception:
             try:
                 folder = os.path.dirname(file_path)
                 if IS_WINDOWS:
                     os.startfile(folder)
                 else:
-                    subprocess.run(["open" if IS_MACOS else "xdg-open", folder])
+                    _launch_detached(["open" if IS_MACOS else "xdg-open", folder])
             except Exception:
                 pass
 
@@ -1492,19 +1645,14 @@ class MuseScoreExtractorApp:
     def open_file_location(self):
         if self.last_extracted_file and os.path.exists(self.last_extracted_file):
             try:
-                if IS_MACOS:
-                    subprocess.run(["open", "-R", self.last_extracted_file])
-                elif IS_WINDOWS:
-                    subprocess.run(["explorer", "/select,", os.path.normpath(self.last_extracted_file)])
-                else:
-                    subprocess.run(["xdg-open", os.path.dirname(self.last_extracted_file)])
+                _launch_detached(_reveal_command(self.last_extracted_file))
             except Exception:
                 try:
                     folder = os.path.dirname(self.last_extracted_file)
                     if IS_WINDOWS:
                         os.startfile(folder)
                     else:
-                        subprocess.run(["open" if IS_MACOS else "xdg-open", folder])
+                        _launch_detached(["open" if IS_MACOS else "xdg-open", folder])
                 except Exception as e2:
                     self.log(f"Error opening file location: {str(e2)}\n")
                     messagebox.showerror("Error", f"Could not open file location:\n{str(e2)}")
@@ -1563,8 +1711,12 @@ class MuseScoreExtractorApp:
         if success and output.strip().lower() == "true":
             return True
 
+        process_names = list_process_names()
+        if process_names is not None:
+            return any("claude" in name.lower() for name in process_names)
         if PSUTIL_AVAILABLE:
             try:
+                psutil = _load_optional("psutil")
                 for proc in psutil.process_iter(["name"]):
                     try:
                         name = (proc.info.get("name") or "").lower()
@@ -1602,12 +1754,12 @@ class MuseScoreExtractorApp:
 
         last_error = "MuseScore process not found."
         for _ in range(20):
-            found, _, find_error = self._find_program_window_macos("musescore")
+            found, process_name, find_error = self._find_program_window_macos("musescore")
             if found:
-                activated, _, activate_error = self._activate_program_window_macos("musescore")
+                activated, _, activate_error = self._activate_program_window_macos("musescore", process_name)
                 if activated:
                     time.sleep(0.15)
-                    sent, _, send_error = self._send_hotkey_macos(hotkey)
+                    sent, _, send_error = self._send_hotkey_macos(hotkey, "musescore", process_name)
                     if sent:
                         return True, ""
                     last_error = send_error or "Could not send macOS shortcut"
@@ -1799,7 +1951,7 @@ class MuseScoreExtractorApp:
 
         if extension in EXTRACTABLE_SCORE_EXTENSIONS:
             self.extract_file(file_path)
-        elif extension in (".mid", ".midi"):
+        elif extension in MIDI_INPUT_EXTENSIONS:
             self.log(f"Skipping extraction for MIDI input: {os.path.basename(file_path)}")
 
         if not self._is_ai_editing_active():
@@ -1844,17 +1996,105 @@ class MuseScoreExtractorApp:
             messagebox.showerror("Error", f"File not found: {file_path}")
             return
 
-        thread = threading.Thread(target=self._extract_thread, args=(file_path,), daemon=True)
-        thread.start()
+        self._run_in_background(self._extract_async(file_path))
+
+    def _start_background_loop(self):
+        """Run one asyncio loop in a background thread for extraction dispatch, folder
+        watching and hotkey request monitoring."""
+        self._background_loop = asyncio.new_event_loop()
+        # A single worker keeps bursts of watch events from running extractions on top of each other.
+        self._extract_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="extract")
+        # The XML parsing itself runs in a long-lived worker process so it never holds the Tk GIL.
+        self._extract_process_pool = ProcessPoolExecutor(max_workers=1)
+        threading.Thread(target=self._background_loop.run_forever, name="background-loop", daemon=True).start()
+
+    def _stop_background_loop(self):
+        """Cancel the tasks still on the background loop, wait for them to unwind, then stop it.
+
+        Cancelling a ``run_coroutine_threadsafe`` future only queues ``task.cancel()``, so the
+        loop has to keep running until the tasks' ``finally`` blocks have executed.
+        """
+        loop = self._background_loop
+
+        async def cancel_pending():
+            current = asyncio.current_task()
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            for task in tasks:
+                # A second cancel would interrupt a task already unwinding from the first
+                # (Task.cancelling() is Python 3.11+).
+                cancelling = getattr(task, "cancelling", None)
+                if cancelling is None or not cancelling():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_pending(), loop).result(timeout=BACKGROUND_SHUTDOWN_TIMEOUT)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        self._extract_executor.shutdown(wait=False)
+        self._extract_process_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run_in_background(self, coro):
+        """Schedule ``coro`` on the background loop from any thread; returns its future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._background_loop)
+
+    async def _extract_async(self, file_path):
+        await self._background_loop.run_in_executor(self._extract_executor, self._extract_thread, file_path)
+
+    def _run_extractor(self, function, *args):
+        """Call an extraction function in the worker process and wait for its result."""
+        try:
+            return self._extract_process_pool.submit(function, *args).result()
+        except BrokenProcessPool:
+            # The worker died (or could not start); replace it and run this one inline.
+            self._extract_process_pool = ProcessPoolExecutor(max_workers=1)
+            return function(*args)
+
+    def _extract_cache_key(self, file_path, output_format):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (os.path.realpath(file_path), st.st_mtime_ns, st.st_size, output_format)
+
+    def _cached_extraction(self, key):
+        if key is None:
+            return None
+        cached_path = self._extract_cache.get(key)
+        if cached_path is None:
+            return None
+        if not os.path.exists(cached_path):
+            del self._extract_cache[key]
+            return None
+        self._extract_cache.move_to_end(key)
+        return cached_path
+
+    def _remember_extraction(self, key, output_path):
+        if key is None or not output_path:
+            return
+        self._extract_cache[key] = output_path
+        self._extract_cache.move_to_end(key)
+        while len(self._extract_cache) > EXTRACT_CACHE_SIZE:
+            self._extract_cache.popitem(last=False)
 
     def _extract_thread(self, file_path):
         output_format = self.output_format.get().strip().lower()
- 
+        source = Path(file_path)
+
         self.log(f"\n{'=' * 60}")
-        self.log(f"Processing: {os.path.basename(file_path)}")
+        self.log(f"Processing: {source.name}")
         self.log(f"Output format: {output_format.upper()}")
         self.log(f"{'=' * 60}\n")
 
+        cache_key = self._extract_cache_key(file_path, output_format)
+        cached_path = self._cached_extraction(cache_key)
+        if cached_path:
+            self.log("File unchanged since last extraction, reusing previous output.")
+            self.log(f"Output saved to: {cached_path}\n")
+            self._handle_successful_extraction(cached_path)
+            return
+
         try:
             if output_format == "midi":
                 if MIDI_EXTRACTION_FUNCTION is None:
@@ -1867,15 +2107,15 @@ class MuseScoreExtractorApp:
 
                 os.makedirs(MIDI_OUTPUT_DIR, exist_ok=True)
 
-                base_name = os.path.splitext(os.path.basename(file_path))[0]
-                output_file = os.path.join(MIDI_OUTPUT_DIR, base_name + ".mid")
+                output_file = os.path.join(MIDI_OUTPUT_DIR, source.stem + ".mid")
 
                 try:
-                    midi_path = MIDI_EXTRACTION_FUNCTION(file_path, output_file)
+                    midi_path = self._run_extractor(MIDI_EXTRACTION_FUNCTION, file_path, output_file)
 
                     if midi_path and os.path.exists(midi_path):
                         self.log("Successfully extracted MIDI!")
                         self.log(f"MIDI file saved to: {midi_path}\n")
+                        self._remember_extraction(cache_key, midi_path)
                         self._handle_successful_extraction(midi_path)
                     else:
                         error_msg = "Failed to extract MIDI file."
@@ -1891,13 +2131,10 @@ class MuseScoreExtractorApp:
             else:
                 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-                base_name = os.path.splitext(os.path.basename(file_path))[0]
-                if EXTRACTION_SCRIPT == "extract_pitches_with_position":
-                    output_file = os.path.join(OUTPUT_DIR, base_name + "_pitches_with_position.txt")
-                else:
-                    output_file = os.path.join(OUTPUT_DIR, base_name + "_pitches.txt")
+                suffix = "_pitches_with_position" if EXTRACTION_SCRIPT == "extract_pitches_with_position" else "_pitches"
+                output_file = os.path.join(OUTPUT_DIR, f"{source.stem}{suffix}.txt")
 
-                result = EXTRACTION_FUNCTION(file_path, output_file, debug=False)
+                result = self._run_extractor(EXTRACTION_FUNCTION, file_path, output_file, False)
 
                 if isinstance(result, tuple) and len(result) == 2:
                     notes, actual_output_path = result
@@ -1908,14 +2145,16 @@ class MuseScoreExtractorApp:
                 if notes:
                     self.log(f"Successfully extracted {len(notes)} notes!")
                     self.log(f"Output saved to: {output_file}\n")
+                    self._remember_extraction(cache_key, output_file)
                     self._handle_successful_extraction(output_file)
 
-                    self.log("First 10 notes:")
+                    preview = ["First 10 notes:"]
                     for i, (pitch, position, tick) in enumerate(notes[:10], 1):
                         if tick is not None:
-                            self.log(f"  {i}. {pitch} | {position} | (tick: {tick})")
+                            preview.append(f"  {i}. {pitch} | {position} | (tick: {tick})")
                         else:
-                            self.log(f"  {i}. {pitch} | {position}")
+                            preview.append(f"  {i}. {pitch} | {position}")
+                    self.log("\n".join(preview))
 
                     if len(notes) > 10:
                         self.log(f"  ... and {len(notes) - 10} more\n")
@@ -1943,120 +2182,249 @@ class MuseScoreExtractorApp:
                 text=f"Status: Watching '{os.path.basename(folder)}'", foreground="green"
             )
             self.log(f"Started watching folder: {folder}\n")
-            self.save_preferences()
+            self._schedule_save()
 
-            self.watch_thread = threading.Thread(target=self._watch_folder, args=(folder,), daemon=True)
-            self.watch_thread.start()
+            self._stop_watch_task()
+            self._watch_future = self._run_in_background(self._watch_folder(folder))
         else:
             self.watching = False
             self.watch_button.config(text="Start Watching")
             self.watch_status_label.config(text="Status: Not watching", foreground="gray")
+            self._stop_watch_task()
             self.log("Stopped watching folder.\n")
-            self.save_preferences()
+            self._schedule_save()
+
+    def _stop_watch_task(self):
+        future = self._watch_future
+        self._watch_future = None
+        if future is not None:
+            future.cancel()
+        # Don't rely on the task's finally alone: it only runs once the loop processes the cancel.
+        stop_fs_watcher = self._stop_fs_watcher
+        self._stop_fs_watcher = None
+        if stop_fs_watcher is not None:
+            stop_fs_watcher()
+
+    def _wake_watch(self):
+        """Wake the watch loop early; safe to call from any thread."""
+        wakeup = self._watch_wakeup
+        if wakeup is not None:
+            self._background_loop.call_soon_threadsafe(wakeup.set)
+
+    def _start_fs_watcher(self, folder):
+        """Wake the watch loop on filesystem events instead of waiting out the poll interval.
+
+        Returns a stop callable (idempotent, safe from any thread), or None when no event
+        source is available.
+        """
+        return self._start_fsevents_watcher(folder) or self._start_watchfiles_watcher(folder)
+
+    def _start_fsevents_watcher(self, folder):
+        if not FSEVENTS_AVAILABLE:
+            return None
+        try:
+            observer = FSEventsObserver()
+            # The observer is a plain thread; never let it keep the process alive on exit.
+            observer.daemon = True
+            stream = FSEventsStream(lambda _event: self._wake_watch(), folder, file_events=True)
+            observer.start()
+            observer.schedule(stream)
+        except Exception as exc:
+            self.log(f"Warning: FSEvents unavailable, polling folder instead: {exc}")
+            return None
 
-    def _watch_folder(self, folder):
-        initial_files = set()
-        for file in os.listdir(folder):
-            if file.lower().endswith(WATCHED_SCORE_EXTENSIONS):
-                full_path = os.path.join(folder, file)
-                initial_files.add(full_path)
+        stopped = threading.Event()
 
-        self.processed_files.update(initial_files)
+        def stop():
+            if stopped.is_set():
+                return
+            stopped.set()
+            try:
+                observer.unschedule(stream)
+                observer.stop()
+                if threading.current_thread() is not observer:
+                    observer.join(timeout=1.0)
+            except Exception:
+                pass
+
+        return stop
+
+    def _start_watchfiles_watcher(self, folder):
+        if not WATCHFILES_AVAILABLE:
+            return None
+        wakeup = self._watch_wakeup
+
+        async def run():
+            try:
+                async for _changes in watchfiles.awatch(folder, recursive=False, debounce=100, step=50):
+                    wakeup.set()
+            except Exception as exc:
+                self.log(f"Warning: watchfiles stopped, falling back to polling: {exc}")
+            # Without events the loop would sleep for the idle interval; poll instead.
+            self._watch_fs_events = False
+            wakeup.set()
+
+        loop = asyncio.get_running_loop()
+        task = loop.create_task(run())
+        return lambda: loop.call_soon_threadsafe(task.cancel)
+
+    async def _watch_folder(self, folder):
+        folder = os.fspath(folder)
+        self._watch_wakeup = asyncio.Event()
+        stop_fs_watcher = self._start_fs_watcher(folder)
+        self._stop_fs_watcher = stop_fs_watcher
+        self._watch_fs_events = stop_fs_watcher is not None
+        try:
+            await self._watch_folder_loop(folder)
+        finally:
+            # A newer watch may already have replaced it; only clear our own.
+            if self._stop_fs_watcher is stop_fs_watcher:
+                self._stop_fs_watcher = None
+            if stop_fs_watcher is not None:
+                stop_fs_watcher()
 
-        output_ext = None
+    def _on_output_format_changed(self, *_args):
         try:
             fmt = (self.output_format.get() or "").strip().lower()
-            output_ext = ".mid" if fmt == "midi" else ".txt"
         except Exception:
-            output_ext = ".txt"
+            fmt = ""
+        self._watch_output_ext_value = ".mid" if fmt == "midi" else ".txt"
 
-        initial_output_files = set()
-        for file in os.listdir(folder):
-            if file.endswith(output_ext):
-                if file.lower().endswith(WATCHED_SCORE_EXTENSIONS):
-                    continue
-                full_path = os.path.join(folder, file)
-                initial_output_files.add(full_path)
+    def _watch_output_ext(self):
+        return self._watch_output_ext_value
+
+    def _watched_file_settled(self, name, entry):
+        """Whether a newly seen score looks fully written.
+
+        Files untouched for a second are accepted outright; fresher ones are accepted
+        once their size and mtime are unchanged since the previous scan.
+        """
+        st = entry.stat()
+        if time.time() - st.st_mtime > 1:
+            self._pending_watch_files.pop(name, None)
+            return True
+        signature = (st.st_mtime_ns, st.st_size)
+        if st.st_size > 0 and self._pending_watch_files.get(name) == signature:
+            del self._pending_watch_files[name]
+            return True
+        self._pending_watch_files[name] = signature
+        return False
+
+    async def _watch_folder_loop(self, folder):
+        output_ext = self._watch_output_ext()
+        # Entries can only have appeared or disappeared if the folder's mtime moved (or the
+        # output type changed), so the folder is only relisted, and pruned, then.
+        scanned_state = (os.stat(folder).st_mtime_ns, output_ext)
+        initial_files, initial_output_files = _scan_watch_folder(folder, output_ext)
+        # Scores are tracked by name, so start from this folder's listing alone.
+        self.processed_files.clear()
+        self.processed_files.update(initial_files)
         self.seen_output_type_files.update(initial_output_files)
+        self._pending_watch_files.clear()
+        pending_files = False
 
         while self.watching:
             try:
-                current_files = set()
-                for file in os.listdir(folder):
-                    if file.lower().endswith(WATCHED_SCORE_EXTENSIONS):
-                        full_path = os.path.join(folder, file)
-                        current_files.add(full_path)
-
-                        if full_path not in self.processed_files:
-                            time.sleep(0.5)
-
-                            try:
-                                mod_time = os.path.getmtime(full_path)
-                                if time.time() - mod_time > 1:
-                                    self.processed_files.add(full_path)
-                                    if self._should_accept_new_file(time.monotonic()):
-                                        self.root.after(0, lambda f=full_path: self.handle_new_score_file(f))
-                            except OSError:
-                                pass
-
-                self.processed_files.intersection_update(current_files)
-
+                output_ext = self._watch_output_ext()
+                folder_mtime_ns = os.stat(folder).st_mtime_ns
+                folder_state = (folder_mtime_ns, output_ext)
+                # A change within the filesystem's timestamp granularity may not move the
+                # mtime, so a freshly modified folder is always relisted.
+                recently_modified = time.time_ns() - folder_mtime_ns < WATCH_MTIME_GRANULARITY_NS
+                if folder_state != scanned_state or pending_files or recently_modified:
+                    pending_files = await self._scan_watch_folder_once(
+                        folder, output_ext, prune=folder_state != scanned_state
+                    )
+                    scanned_state = folder_state
+                if pending_files:
+                    timeout = WATCH_SETTLE_SAMPLE_INTERVAL
+                elif self._watch_fs_events:
+                    timeout = WATCH_IDLE_RESCAN_INTERVAL
+                else:
+                    timeout = WATCH_POLL_INTERVAL
                 try:
-                    fmt = (self.output_format.get() or "").strip().lower()
-                    output_ext = ".mid" if fmt == "midi" else ".txt"
-                except Exception:
-                    output_ext = ".txt"
-
-                current_output_files = set()
-                for file in os.listdir(folder):
-                    if file.endswith(output_ext):
-                        if file.lower().endswith(WATCHED_SCORE_EXTENSIONS):
-                            continue
-                        full_path = os.path.join(folder, file)
-                        current_output_files.add(full_path)
-                        if full_path not in self.seen_output_type_files:
-                            dest_path = self._clear_output_folder_and_move(full_path, output_ext)
-                            if dest_path is not None:
-                                self.seen_output_type_files.add(full_path)
-                                self.root.after(0, self._bring_app_to_front)
-                                self.root.after(0, lambda p=dest_path: self._handle_successful_extraction(p))
-                                self.log(f"Cleared output folder and moved {os.path.basename(full_path)} to: {dest_path}")
-                            else:
-                                self.log(f"Skipped or failed moving {os.path.basename(full_path)} to output folder")
-
-                self.seen_output_type_files.intersection_update(current_output_files)
-                time.sleep(1)
+                    await asyncio.wait_for(self._watch_wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._watch_wakeup.clear()
 
             except Exception as e:
                 if self.watching:
                     self.log(f"Error watching folder: {str(e)}\n")
-                time.sleep(2)
+                    self._log_traceback()
+                await asyncio.sleep(2)
+
+    async def _scan_watch_folder_once(self, folder, output_ext, prune):
+        """List the watch folder and dispatch new scores and output files.
+
+        Returns True if some new score is still being written and needs another look.
+        """
+        pending_files = False
+        current_files, current_output_files = _scan_watch_folder(folder, output_ext)
+        for name, entry in current_files.items():
+            if name not in self.processed_files:
+                try:
+                    if self._watched_file_settled(name, entry):
+                        self.processed_files.add(name)
+                        if self._should_accept_new_file(time.monotonic()):
+                            self.root.after(0, lambda f=entry.path: self.handle_new_score_file(f))
+                    else:
+                        pending_files = True
+                except OSError:
+                    pass
+
+        if prune:
+            self.processed_files.intersection_update(current_files)
+            for gone in self._pending_watch_files.keys() - current_files.keys():
+                del self._pending_watch_files[gone]
+
+        for full_path in current_output_files:
+            if full_path not in self.seen_output_type_files:
+                # May wait on a confirmation dialog, so keep it off the loop thread.
+                dest_path = await asyncio.to_thread(
+                    self._clear_output_folder_and_move, full_path, output_ext
+                )
+                if dest_path is not None:
+                    self.seen_output_type_files.add(full_path)
+                    self.root.after(0, self._bring_app_to_front)
+                    self.root.after(0, lambda p=dest_path: self._handle_successful_extraction(p))
+                    self.log(f"Cleared output folder and moved {os.path.basename(full_path)} to: {dest_path}")
+                else:
+                    self.log(f"Skipped or failed moving {os.path.basename(full_path)} to output folder")
+
+        if prune:
+            self.seen_output_type_files.intersection_update(current_output_files)
+        return pending_files
 
     def _find_program_window_macos(self, program_id):
+        cached_name = _cached_process_name(program_id)
+        if cached_name:
+            return True, cached_name, ""
+
         profile = PROGRAM_PROFILES[program_id]
 
-        for process_name in profile["mac_process_names"]:
-            script = f"""
-            tell application "System Events"
-                try
-                    set targetProcess to first process whose name is "{process_name}"
-                    return name of targetProcess
-                on error
-                    return ""
-                end try
-            end tell
-            """
-            success, output, _ = run_applescript(script)
-            if success and output and output.strip():
-                return True, output.strip(), ""
+        script = _find_process_script(profile["mac_process_names"], profile["mac_contains"])
+        success, output, _ = run_applescript(script)
+        if success and output and output.strip():
+            _remember_process_name(program_id, output.strip())
+            return True, output.strip(), ""
 
-        if PSUTIL_AVAILABLE:
+        process_names = list_process_names()
+        if process_names is not None:
+            for proc_name in process_names:
+                proc_lower = proc_name.lower()
+                if any(keyword in proc_lower for keyword in profile["mac_contains"]):
+                    _remember_process_name(program_id, proc_name)
+                    return True, proc_name, ""
+        elif PSUTIL_AVAILABLE:
             try:
+                psutil = _load_optional("psutil")
                 for proc in psutil.process_iter(["name"]):
                     try:
                         proc_name = proc.info.get("name") or ""
                         proc_lower = proc_name.lower()
                         if any(keyword in proc_lower for keyword in profile["mac_contains"]):
+                            _remember_process_name(program_id, proc_name)
                             return True, proc_name, ""
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         continue
@@ -2065,65 +2433,119 @@ class MuseScoreExtractorApp:
 
         return False, "", f"{profile['label']} process not found"
 
-    def _activate_program_window_macos(self, program_id):
+    def _activate_program_window_macos(self, program_id, process_name=None):
         profile = PROGRAM_PROFILES[program_id]
 
-        for app_name in profile["mac_app_names"]:
-            script = f"""
-            tell application "{app_name}"
-                activate
-            end tell
-            """
-            success, output, error = run_applescript(script)
-            if success:
-                return True, output, error
-
-        for process_name in profile["mac_process_names"]:
+        if process_name:
+            # Known process: raise it directly instead of walking every candidate name, and
+            # report "true|front" once it is actually frontmost ("true" if it never got there).
             script = f"""
             tell application "System Events"
-                try
-                    set targetProcess to first process whose name is "{process_name}"
-                    set frontmost of targetProcess to true
-                    return true
-                on error
-                    return false
-                end try
+                set frontmost of process "{process_name}" to true
+                repeat 20 times
+                    if frontmost of process "{process_name}" then return "true|front"
+                    delay 0.025
+                end repeat
             end tell
+            return "true"
             """
             success, output, error = run_applescript(script)
-            if success and output.strip().lower() == "true":
+            if success and output.strip().lower().partition("|")[0] == "true":
+                _remember_process_name(program_id, process_name, PROCESS_NAME_CONFIRMED_TTL)
                 return True, output, error
+            _forget_process_name(program_id)
 
-        return False, "", f"Could not activate {profile['label']}"
+        script = _activate_process_script(profile["mac_app_names"], profile["mac_process_names"])
+        success, output, error = run_applescript(script)
+        if success and output.strip().lower() == "true":
+            return True, output, error
 
-    def _send_hotkey_macos(self, normalized_hotkey):
-        modifiers, key = _split_normalized_hotkey(normalized_hotkey)
-        key_to_send = " " if key == "space" else key
-        modifier_tokens = []
-        for mod in modifiers:
-            if mod == "cmd":
-                modifier_tokens.append("command down")
-            elif mod == "ctrl":
-                modifier_tokens.append("control down")
-            elif mod == "alt":
-                modifier_tokens.append("option down")
-            elif mod == "shift":
-                modifier_tokens.append("shift down")
+        _forget_process_name(program_id)
+        return False, "", error or f"Could not activate {profile['label']}"
 
-        if modifier_tokens:
-            using_clause = " using {" + ", ".join(modifier_tokens) + "}"
-        else:
-            using_clause = ""
+    def _activate_and_send_hotkey_macos(self, program_id, normalized_hotkey):
+        """Find, raise and send the shortcut to the program with a single osascript.
+
+        Returns ``(process_name, activated)`` on success, ``("", False)`` when no
+        matching process is running, or None if the script itself failed so the caller
+        can fall back to the step-by-step flow (which reports precise errors).
+        """
+        profile = PROGRAM_PROFILES[program_id]
+        candidates = list(profile["mac_process_names"])
+        cached_name = _cached_process_name(program_id)
+        if cached_name:
+            candidates.insert(0, cached_name)
+        contains_test = " or ".join(f'procText contains "{keyword}"' for keyword in profile["mac_contains"]) or "false"
+
+        script = f"""
+        tell application "System Events"
+            set targetName to ""
+            repeat with candidateName in {_applescript_list(candidates)}
+                if exists process (candidateName as text) then
+                    set targetName to candidateName as text
+                    exit repeat
+                end if
+            end repeat
+            if targetName is "" then
+                repeat with procName in (name of every process)
+                    set procText to procName as text
+                    if {contains_test} then
+                        set targetName to procText
+                        exit repeat
+                    end if
+                end repeat
+            end if
+            if targetName is "" then return ""
+            set frontmost of process targetName to true
+            -- Send as soon as the app is in front instead of after a fixed delay.
+            set activated to "no"
+            repeat 20 times
+                if frontmost of process targetName then
+                    set activated to "yes"
+                    exit repeat
+                end if
+                delay 0.025
+            end repeat
+            tell process targetName
+                {_keystroke_command(normalized_hotkey)}
+            end tell
+            return targetName & "|" & activated
+        end tell
+        """
+        success, output, _ = run_applescript(script)
+        if not success:
+            _forget_process_name(program_id)
+            return None
+        process_name, _, activated = output.strip().partition("|")
+        if not process_name:
+            _forget_process_name(program_id)
+            return "", False
+        _remember_process_name(program_id, process_name, PROCESS_NAME_CONFIRMED_TTL)
+        return process_name, activated == "yes"
+
+    def _send_hotkey_macos(self, normalized_hotkey, program_id=None, process_name=None):
+        keystroke_line = _keystroke_command(normalized_hotkey)
+        if process_name:
+            # Wait (briefly) for the process to come to the front rather than sleeping a fixed time.
+            keystroke_line = f"""repeat 20 times
+                if frontmost of process "{process_name}" then exit repeat
+                delay 0.025
+            end repeat
+            tell process "{process_name}"
+                {keystroke_line}
+            end tell"""
 
         script = f"""
         tell application "System Events"
-            keystroke "{key_to_send}"{using_clause}
+            {keystroke_line}
             return true
         end tell
         """
         success, output, error = run_applescript(script)
         if success and output.strip().lower() == "true":
             return True, output, error
+        if program_id:
+            _forget_process_name(program_id)
         return False, output, error or "Could not send macOS shortcut"
 
     def _find_program_window_windows(self, program_id):
@@ -2156,6 +2578,7 @@ class MuseScoreExtractorApp:
 
         if PSUTIL_AVAILABLE:
             try:
+                psutil = _load_optional("psutil")
                 for proc in psutil.process_iter(["pid", "name", "exe"]):
                     try:
                         proc_name = (proc.info.get("name") or "").lower()
@@ -2229,6 +2652,7 @@ class MuseScoreExtractorApp:
             try:
                 main_window.set_focus()
                 time.sleep(0.2)
+                pyautogui = _load_optional("pyautogui")
                 pyautogui.hotkey(*pyautogui_keys)
                 shortcut_sent = True
                 self.log("OK: Sent shortcut using pyautogui hotkey()")
@@ -2240,6 +2664,7 @@ class MuseScoreExtractorApp:
             try:
                 main_window.set_focus()
                 time.sleep(0.2)
+                pyautogui = _load_optional("pyautogui")
                 for mod in pyautogui_keys[:-1]:
                     pyautogui.keyDown(mod)
                 pyautogui.press(pyautogui_keys[-1])
@@ -2267,8 +2692,18 @@ class MuseScoreExtractorApp:
             messagebox.showerror("Platform Error", "This feature is only available on macOS and Windows.")
             return
 
-        thread = threading.Thread(target=self._trigger_save_selection_thread, daemon=True)
-        thread.start()
+        self._run_in_background(self._trigger_save_selection_async())
+
+    async def _trigger_save_selection_async(self):
+        # Runs on the background loop, so the in-flight flag needs no lock.
+        if self._save_trigger_running:
+            self.log("Save/export already in progress; ignoring repeated trigger.")
+            return
+        self._save_trigger_running = True
+        try:
+            await asyncio.to_thread(self._trigger_save_selection_thread)
+        finally:
+            self._save_trigger_running = False
 
     def _trigger_save_selection_thread(self):
         if IS_MACOS:
@@ -2290,37 +2725,48 @@ class MuseScoreExtractorApp:
                 return
 
             self.log(f"Attempting to trigger save/export in {program_label}...")
+            shortcut_label = _format_hotkey_label(effective_hotkey)
+            fused_result = self._activate_and_send_hotkey_macos(program_id, effective_hotkey)
+            if fused_result is not None:
+                process_name, activated = fused_result
+                if not process_name:
+                    # The fused script already scanned every process; don't scan again.
+                    self._report_program_not_found_macos(program_label, f"{program_label} process not found")
+                    return
+                if activated:
+                    self.log(f"OK: Found and activated {program_label} ({process_name}), sent {shortcut_label}")
+                else:
+                    self.log(
+                        f"Warning: {program_label} ({process_name}) did not come to the front; sent {shortcut_label} anyway"
+                    )
+                self.log(f"Please complete the save/export dialog in {program_label}...")
+                return
+
             self.log(f"Step 1: Finding {program_label} window...")
             success, output, error = self._find_program_window_macos(program_id)
             if not success:
-                self.log(f"Error: Could not find {program_label} window")
-                self.log(f"Error: {error}")
-                self.root.after(
-                    0,
-                    lambda: messagebox.showerror(
-                        f"{program_label} Not Found",
-                        f"Could not find a running {program_label} window.\n\n"
-                        f"Please ensure {program_label} is open and try again.\n\n"
-                        "Check the output log for details.",
-                    ),
-                )
+                self._report_program_not_found_macos(program_label, error)
                 return
 
             self.log(f"OK: Found {program_label}: {output}")
             self.log(f"Step 2: Activating {program_label} window...")
-            activated, _, activate_error = self._activate_program_window_macos(program_id)
+            activated, activate_output, activate_error = self._activate_program_window_macos(program_id, output)
+            # Only a confirmed frontmost process may receive a chord posted to the HID tap.
+            in_front = activated and activate_output.strip().lower().endswith("|front")
             if activated:
                 self.log(f"OK: Activated {program_label} window")
             else:
                 self.log(f"Warning: Could not activate {program_label}: {activate_error}")
 
-            time.sleep(0.5)
-            shortcut_label = _format_hotkey_label(effective_hotkey)
             self.log(f"Step 3: Sending keyboard shortcut {shortcut_label}...")
-            sent, _, send_error = self._send_hotkey_macos(effective_hotkey)
+            # Once the program is confirmed in front, post the chord directly instead of running
+            # another osascript; otherwise let System Events wait for it and target the process.
+            if in_front and post_hotkey(*_split_normalized_hotkey(effective_hotkey)):
+                sent, send_error = True, ""
+            else:
+                sent, _, send_error = self._send_hotkey_macos(effective_hotkey, program_id, output)
             if sent:
                 self.log("OK: Keyboard shortcut sent successfully!")
-                time.sleep(0.5)
                 self.log(f"Please complete the save/export dialog in {program_label}...")
             else:
                 self.log(f"Error: Failed to send keyboard shortcut: {send_error}")
@@ -2335,11 +2781,22 @@ class MuseScoreExtractorApp:
         except Exception as e:
             error_msg = f"Error triggering save/export: {str(e)}"
             self.log(f"Error: {error_msg}")
-            import traceback
-
-            self.log(f"Traceback:\n{traceback.format_exc()}")
+            self._log_traceback()
             self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
 
+    def _report_program_not_found_macos(self, program_label, error):
+        self.log(f"Error: Could not find {program_label} window")
+        self.log(f"Error: {error}")
+        self.root.after(
+            0,
+            lambda: messagebox.showerror(
+                f"{program_label} Not Found",
+                f"Could not find a running {program_label} window.\n\n"
+                f"Please ensure {program_label} is open and try again.\n\n"
+                "Check the output log for details.",
+            ),
+        )
+
     def _trigger_save_selection_windows(self):
         app = None
         main_window = None
@@ -2444,35 +2901,175 @@ class MuseScoreExtractorApp:
         except Exception as e:
             error_msg = f"Error triggering save/export: {str(e)}"
             self.log(f"Error: {error_msg}")
-            import traceback
-
-            self.log(f"Traceback:\n{traceback.format_exc()}")
+            self._log_traceback()
             self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
 
     def setup_hotkey_request_monitor(self):
+        if self._setup_hotkey_request_socket():
+            return
+
         self.hotkey_request_path = HOTKEY_REQUEST_FILE
         try:
-            if not self.hotkey_request_path.exists():
+            try:
+                self._last_hotkey_request = self.hotkey_request_path.stat().st_mtime
+            except FileNotFoundError:
                 self.hotkey_request_path.write_text("0")
-            self._last_hotkey_request = self.hotkey_request_path.stat().st_mtime
+                self._last_hotkey_request = self.hotkey_request_path.stat().st_mtime
         except Exception:
             self._last_hotkey_request = 0
 
-        monitor_thread = threading.Thread(target=self._monitor_hotkey_request, daemon=True)
-        monitor_thread.start()
+        self._hotkey_monitor_future = self._run_in_background(self._monitor_hotkey_request())
+
+    def _setup_hotkey_request_socket(self):
+        """Listen for listener requests on a datagram socket serviced by the Tk event loop.
+
+        Returns False where that is unavailable (Windows), so the caller falls back to
+        polling the request file.
+        """
+        if IS_WINDOWS or not hasattr(socket, "AF_UNIX"):
+            return False
+
+        socket_path = str(HOTKEY_SOCKET_PATH)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            try:
+                os.unlink(socket_path)
+            except FileNotFoundError:
+                pass
+            sock.bind(socket_path)
+            sock.setblocking(False)
+            self.root.tk.createfilehandler(sock, tk.READABLE, self._on_hotkey_request_socket)
+        except (OSError, AttributeError, tk.TclError):
+            sock.close()
+            return False
+
+        self._hotkey_socket = sock
+        return True
+
+    def _on_hotkey_request_socket(self, sock, _mask):
+        try:
+            # Coalesce a burst of presses into a single trigger.
+            while sock.recv(64):
+                pass
+        except BlockingIOError:
+            pass
+        except OSError:
+            return
+        self.log("Global hotkey request detected (background listener, triggering save/export).")
+        self.trigger_save_selection()
+
+    def _close_hotkey_request_socket(self):
+        sock = self._hotkey_socket
+        if sock is None:
+            return
+        self._hotkey_socket = None
+        try:
+            self.root.tk.deletefilehandler(sock)
+        except Exception:
+            pass
+        sock.close()
+        try:
+            os.unlink(str(HOTKEY_SOCKET_PATH))
+        except OSError:
+            pass
+
+    def _check_hotkey_request(self):
+        try:
+            mtime = self.hotkey_request_path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime > self._last_hotkey_request:
+            self._last_hotkey_request = mtime
+            self.log("Global hotkey request detected (background listener, triggering save/export).")
+            self.root.after(0, self.trigger_save_selection)
+
+    async def _monitor_hotkey_request(self):
+        if hasattr(select, "kqueue"):
+            try:
+                await self._monitor_hotkey_request_kqueue()
+                return
+            except (OSError, NotImplementedError):
+                pass
+        if WATCHFILES_AVAILABLE:
+            try:
+                await self._monitor_hotkey_request_watchfiles()
+                return
+            except Exception:
+                pass
 
-    def _monitor_hotkey_request(self):
-        while not self._hotkey_monitor_stop.is_set():
+        wait_interval = 0.6
+        while True:
+            await asyncio.sleep(wait_interval)
             try:
-                if self.hotkey_request_path.exists():
-                    mtime = self.hotkey_request_path.stat().st_mtime
-                    if mtime > self._last_hotkey_request:
-                        self._last_hotkey_request = mtime
-                        self.log("Global hotkey request detected (background listener, triggering save/export).")
-                        self.root.after(0, self.trigger_save_selection)
-                time.sleep(0.6)
+                self._check_hotkey_request()
+                wait_interval = 0.6
             except Exception:
-                time.sleep(1)
+                wait_interval = 1.0
+
+    async def _monitor_hotkey_request_kqueue(self):
+        """Wait on kqueue until the request file is written, instead of polling its mtime.
+
+        The kqueue descriptor is registered with the background loop, so the wait costs
+        nothing and ends when the task is cancelled. Raises OSError if the file cannot be
+        watched, so the caller can fall back to polling.
+        """
+        watched = select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | select.KQ_NOTE_ATTRIB
+        replaced = select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME
+        loop = asyncio.get_running_loop()
+        kq = select.kqueue()
+        ready = asyncio.Event()
+        try:
+            loop.add_reader(kq.fileno(), ready.set)
+            while True:
+                fd = os.open(str(self.hotkey_request_path), os.O_RDONLY)
+                try:
+                    kq.control(
+                        [
+                            select.kevent(
+                                fd,
+                                select.KQ_FILTER_VNODE,
+                                select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                                fflags=watched | replaced,
+                            )
+                        ],
+                        0,
+                    )
+                    # The listener may have written before the watch was armed.
+                    self._check_hotkey_request()
+                    reopen = False
+                    while not reopen:
+                        await ready.wait()
+                        ready.clear()
+                        for event in kq.control(None, 4, 0):
+                            if event.fflags & replaced:
+                                reopen = True
+                        self._check_hotkey_request()
+                finally:
+                    os.close(fd)
+        finally:
+            loop.remove_reader(kq.fileno())
+            kq.close()
+
+    async def _monitor_hotkey_request_watchfiles(self):
+        """Wait for OS change notifications on the request file instead of polling it."""
+        request_path = os.path.normcase(os.path.abspath(self.hotkey_request_path))
+
+        def is_request_file(_change, path):
+            return os.path.normcase(path) == request_path
+
+        async for _changes in watchfiles.awatch(
+            self.hotkey_request_path.parent,
+            watch_filter=is_request_file,
+            recursive=False,
+            debounce=100,
+        ):
+            self._check_hotkey_request()
+
+    def _stop_hotkey_request_monitor(self):
+        future = self._hotkey_monitor_future
+        self._hotkey_monitor_future = None
+        if future is not None:
+            future.cancel()
 
     def register_global_hotkey(self):
         if self.disable_global_hotkey:
@@ -2521,6 +3118,7 @@ class MuseScoreExtractorApp:
             return
 
         try:
+            keyboard = _load_optional("keyboard")
             keyboard.add_hotkey(hotkey, self.trigger_save_selection, suppress=False)
             self.log(f"OK: Global hotkey registered: {_format_hotkey_label(hotkey)}")
             self.log("  You can now press the hotkey from anywhere to trigger save/export automation!")
@@ -2538,18 +3136,47 @@ class MuseScoreExtractorApp:
                 self._pynput_listener.stop()
             except Exception:
                 pass
-        elif not IS_MACOS and KEYBOARD_AVAILABLE:
+        elif not IS_MACOS and "keyboard" in _LAZY_MODULES:
             try:
-                keyboard.unhook_all_hotkeys()
+                _LAZY_MODULES["keyboard"].unhook_all_hotkeys()
             except Exception:
                 pass
-        self._hotkey_monitor_stop.set()
         watching_state = self.watching
-        self.save_preferences(watching_override=watching_state)
         self.watching = False
+        # Cancel the background tasks before the loop stops, so their cleanup gets to run.
+        self._stop_watch_task()
+        self._stop_hotkey_request_monitor()
+        self._close_hotkey_request_socket()
+        self._stop_background_loop()
+        _OSASCRIPT_SESSION.close()
+        # The final save below supersedes any pending debounced write.
+        self._cancel_scheduled_save()
+        self.save_preferences(watching_override=watching_state)
+        if self._log_flush_after_id is not None:
+            self.root.after_cancel(self._log_flush_after_id)
+            self._log_flush_after_id = None
         self.root.destroy()
 
 
+def _write_pid_file():
+    """Advertise this GUI instance to the hotkey listener."""
+    pid = str(os.getpid())
+    try:
+        GUI_PID_FILE.write_text(pid)
+    except OSError:
+        return
+
+    def remove_pid_file():
+        try:
+            # Leave the file alone if a newer instance has taken it over.
+            if GUI_PID_FILE.read_text().strip() == pid:
+                GUI_PID_FILE.unlink()
+        except OSError:
+            pass
+
+    atexit.register(remove_pid_file)
+
+
 def main():
     parser = argparse.ArgumentParser(description="MuseScore Pitch Extractor GUI")
     parser.add_argument(
@@ -2562,14 +3189,21 @@ def main():
         action="store_true",
         help="Skip registering the in-app hotkey (used by the background listener).",
     )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Log full tracebacks for automation and folder-watch errors.",
+    )
 
     args = parser.parse_args()
 
+    _write_pid_file()
     root = tk.Tk()
     app = MuseScoreExtractorApp(
         root,
         trigger_on_start=args.trigger_save_selection,
         disable_global_hotkey=args.disable_global_hotkey,
+        debug_mode=args.debug,
     )
     root.mainloop()
 
@@ -0,0 +1,78 @@
+import ctypes
+import ctypes.util
+
+from music_clipboard.platform.runtime import IS_MACOS
+
+# CGEventTapLocation / CGEventFlags values from <CoreGraphics/CGEventTypes.h>.
+_KCG_HID_EVENT_TAP = 0
+_MODIFIER_FLAGS = {
+    "shift": 0x00020000,
+    "ctrl": 0x00040000,
+    "alt": 0x00080000,
+    "cmd": 0x00100000,
+}
+
+# ANSI virtual key codes (kVK_ANSI_* in <HIToolbox/Events.h>).
+_KEY_CODES = {
+    "a": 0, "s": 1, "d": 2, "f": 3, "h": 4, "g": 5, "z": 6, "x": 7, "c": 8, "v": 9,
+    "b": 11, "q": 12, "w": 13, "e": 14, "r": 15, "y": 16, "t": 17, "1": 18, "2": 19,
+    "3": 20, "4": 21, "6": 22, "5": 23, "9": 25, "7": 26, "8": 28, "0": 29, "o": 31,
+    "u": 32, "i": 34, "p": 35, "l": 37, "j": 38, "k": 40, "n": 45, "m": 46,
+    "space": 49,
+}
+
+_core_graphics = None
+
+
+def _load_core_graphics():
+    global _core_graphics
+    if _core_graphics is None:
+        path = ctypes.util.find_library("CoreGraphics")
+        if path is None:
+            raise OSError("CoreGraphics not found")
+        cg = ctypes.CDLL(path)
+        cg.CGEventCreateKeyboardEvent.restype = ctypes.c_void_p
+        cg.CGEventCreateKeyboardEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint16, ctypes.c_bool]
+        cg.CGEventSetFlags.restype = None
+        cg.CGEventSetFlags.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+        cg.CGEventPost.restype = None
+        cg.CGEventPost.argtypes = [ctypes.c_uint32, ctypes.c_void_p]
+        cg.CFRelease.restype = None
+        cg.CFRelease.argtypes = [ctypes.c_void_p]
+        _core_graphics = cg
+    return _core_graphics
+
+
+def _macos_post_hotkey(modifiers, key) -> bool:
+    key_code = _KEY_CODES.get(key)
+    if key_code is None:
+        return False
+    cg = _load_core_graphics()
+    flags = 0
+    for modifier in modifiers:
+        flags |= _MODIFIER_FLAGS.get(modifier, 0)
+
+    for key_down in (True, False):
+        event = cg.CGEventCreateKeyboardEvent(None, key_code, key_down)
+        if not event:
+            return False
+        try:
+            cg.CGEventSetFlags(event, flags)
+            cg.CGEventPost(_KCG_HID_EVENT_TAP, event)
+        finally:
+            cg.CFRelease(event)
+    return True
+
+
+def post_hotkey(modifiers, key) -> bool:
+    """Post a key chord (e.g. ``["cmd", "shift"], "s"``) to the frontmost app in-process.
+
+    Returns False where this is unavailable (non-macOS, unknown key, or the call failed),
+    so callers can fall back to AppleScript.
+    """
+    if not IS_MACOS:
+        return False
+    try:
+        return _macos_post_hotkey(modifiers, key)
+    except (OSError, AttributeError, TypeError):
+        return False
@@ -0,0 +1,157 @@
+import json
+import select
+import subprocess
+import threading
+from typing import Optional, Tuple
+
+from music_clipboard.platform.runtime import IS_MACOS
+
+# JXA evaluator kept alive for the whole session. Each request is one JSON-encoded
+# AppleScript source per line; each reply is one JSON object per line. Scripts are
+# compiled once by NSAppleScript and reused for repeat calls.
+_EVALUATOR = r"""
+ObjC.import('Foundation');
+var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+var compiled = {};
+var pending = '';
+
+function reply(obj) {
+  var line = $.NSString.alloc.initWithUTF8String(JSON.stringify(obj) + '\n');
+  stdout.writeData(line.dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+function run(source) {
+  var script = compiled[source];
+  if (!script) {
+    script = $.NSAppleScript.alloc.initWithSource(source);
+    compiled[source] = script;
+  }
+  var error = Ref();
+  var result = script.executeAndReturnError(error);
+  if (result.isNil()) {
+    var info = error[0];
+    var message = info ? ObjC.unwrap(info.objectForKey('NSAppleScriptErrorMessage')) : '';
+    return {ok: false, out: '', err: message || 'AppleScript returned an error'};
+  }
+  var text = ObjC.unwrap(result.stringValue);
+  if (text === undefined || text === null) {
+    // Booleans don't coerce to text; print them the way osascript does.
+    var type = result.descriptorType;
+    if (type == 0x74727565 || type == 0x66616c73 || type == 0x626f6f6c) {
+      text = result.booleanValue ? 'true' : 'false';
+    }
+  }
+  return {ok: true, out: text || '', err: ''};
+}
+
+while (true) {
+  var data = stdin.availableData;
+  if (data.length == 0) break;
+  pending += ObjC.unwrap($.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding));
+  var idx;
+  while ((idx = pending.indexOf('\n')) >= 0) {
+    var line = pending.slice(0, idx);
+    pending = pending.slice(idx + 1);
+    var response;
+    try {
+      response = run(JSON.parse(line));
+    } catch (e) {
+      response = {ok: false, out: '', err: String(e)};
+    }
+    reply(response);
+  }
+}
+"""
+
+
+class OsascriptSession:
+    """A single long-lived osascript process that runs AppleScript snippets on demand.
+
+    Avoids spawning (and registering with LaunchServices) a new osascript per call.
+    """
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def _ensure_started(self) -> bool:
+        if self._proc is not None and self._proc.poll() is None:
+            return True
+        if self._failed or not IS_MACOS:
+            return False
+        try:
+            self._proc = subprocess.Popen(
+                ["osascript", "-l", "JavaScript", "-e", _EVALUATOR],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError:
+            self._failed = True
+            self._proc = None
+            return False
+        return True
+
+    def start(self) -> bool:
+        """Launch the evaluator ahead of the first call; returns False if it is unavailable."""
+        with self._lock:
+            return self._ensure_started()
+
+    def run(self, script: str, timeout: float = 10) -> Optional[Tuple[bool, str, str]]:
+        """Run ``script`` and return ``(success, stdout, stderr)``.
+
+        Returns None if the session is unavailable or died, so the caller can fall
+        back to a one-shot osascript.
+        """
+        with self._lock:
+            if not self._ensure_started():
+                return None
+            proc = self._proc
+            try:
+                # ensure_ascii keeps each request a single ASCII line.
+                proc.stdin.write(json.dumps(script) + "\n")
+                proc.stdin.flush()
+                ready, _, _ = select.select([proc.stdout], [], [], timeout)
+                if not ready:
+                    self._kill()
+                    return False, "", "Timeout"
+                line = proc.stdout.readline()
+                reply = json.loads(line) if line else None
+            except (OSError, ValueError):
+                reply = None
+            if not isinstance(reply, dict):
+                # The evaluator itself is broken; stop retrying and use one-shot calls.
+                self._failed = True
+                self._kill()
+                return None
+            return bool(reply.get("ok")), (reply.get("out") or "").strip(), (reply.get("err") or "").strip()
+
+    def _kill(self) -> None:
+        proc = self._proc
+        self._proc = None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            proc = self._proc
+            self._proc = None
+            if proc is None:
+                return
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                try:
+                    proc.kill()
+                except OSError:
+                    pass
@@ -0,0 +1,66 @@
+import ctypes
+import ctypes.util
+import errno
+from typing import List, Optional
+
+from music_clipboard.platform.runtime import IS_MACOS
+
+# sysctl(3) selectors for the kernel process table on macOS.
+_CTL_KERN = 1
+_KERN_PROC = 14
+_KERN_PROC_ALL = 0
+
+# struct kinfo_proc layout on 64-bit macOS (see <sys/sysctl.h> / <sys/proc.h>).
+_KINFO_PROC_SIZE = 648
+_P_COMM_OFFSET = 243
+_P_COMM_SIZE = 17  # MAXCOMLEN + 1
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    return _libc
+
+
+def _macos_process_names() -> Optional[List[str]]:
+    libc = _load_libc()
+    mib = (ctypes.c_int * 3)(_CTL_KERN, _KERN_PROC, _KERN_PROC_ALL)
+    size = ctypes.c_size_t(0)
+
+    for _ in range(3):
+        if libc.sysctl(mib, 3, None, ctypes.byref(size), None, 0) != 0:
+            return None
+        # Leave room for processes spawned between the two calls.
+        size.value += 16 * _KINFO_PROC_SIZE
+        buffer = ctypes.create_string_buffer(size.value)
+        if libc.sysctl(mib, 3, buffer, ctypes.byref(size), None, 0) == 0:
+            break
+        if ctypes.get_errno() != errno.ENOMEM:
+            return None
+    else:
+        return None
+
+    raw = buffer.raw[: size.value]
+    names = []
+    for offset in range(_P_COMM_OFFSET, len(raw), _KINFO_PROC_SIZE):
+        comm = raw[offset : offset + _P_COMM_SIZE].split(b"\0", 1)[0]
+        if comm:
+            names.append(comm.decode("utf-8", "replace"))
+    return names
+
+
+def list_process_names() -> Optional[List[str]]:
+    """Short names of all running processes from a single kernel query.
+
+    Returns None where no fast path is available (non-macOS, or the call failed),
+    so callers can fall back to psutil.
+    """
+    if not IS_MACOS:
+        return None
+    try:
+        return _macos_process_names()
+    except (OSError, AttributeError, TypeError):
+        return None
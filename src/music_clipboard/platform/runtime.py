@@ -1,5 +1,6 @@
 import os
 import platform
+import tempfile
 from pathlib import Path
 from typing import List, Tuple
 
@@ -39,6 +40,25 @@ def output_read_dirs() -> Tuple[List[Path], List[Path]]:
     return text_candidates, midi_candidates
 
 
+def note_cache_dir() -> Path:
+    # Parsed note tables keyed by score content, reused across runs.
+    if IS_WINDOWS:
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "music-clipboard" / "notes"
+
+
+def gui_pid_file() -> Path:
+    # Written by the GUI at startup so the hotkey listener can find it cheaply.
+    return Path(tempfile.gettempdir()) / "musescore_gui.pid"
+
+
+def hotkey_socket_path() -> Path:
+    # Datagram socket the GUI listens on for hotkey requests (POSIX only).
+    return Path(tempfile.gettempdir()) / "musescore_hotkey.sock"
+
+
 def default_hotkey() -> str:
     return "ctrl+cmd+s" if IS_MACOS else "ctrl+alt+s"
 